@@ -100,6 +100,58 @@ async def create_celestial_events_table():
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/create-trigram-indexes")
+async def create_trigram_indexes():
+    """
+    Create pg_trgm GIN indexes for the prophecy/celestial sign name filters.
+    WARNING: This endpoint should be protected or removed in production!
+    """
+    try:
+        # Run index creation script
+        result = subprocess.run(
+            ["python", "create_trigram_indexes.py"],
+            capture_output=True,
+            text=True,
+            cwd="/app"  # Railway container working directory
+        )
+
+        return {
+            "status": "success" if result.returncode == 0 else "error",
+            "return_code": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/create-theological-indexes")
+async def create_theological_indexes():
+    """
+    Create the ordering indexes used by the theological list endpoints.
+    WARNING: This endpoint should be protected or removed in production!
+    """
+    try:
+        # Run index creation script
+        result = subprocess.run(
+            ["python", "create_theological_indexes.py"],
+            capture_output=True,
+            text=True,
+            cwd="/app"  # Railway container working directory
+        )
+
+        return {
+            "status": "success" if result.returncode == 0 else "error",
+            "return_code": result.returncode,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/check-tables")
 async def check_tables():
     """
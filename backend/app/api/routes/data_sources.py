@@ -2,10 +2,15 @@
 Data Source Management API Routes
 Handles ESA/NASA fallback and data source status
 """
-from fastapi import APIRouter, Query, HTTPException
-from typing import Optional, Literal
+from fastapi import APIRouter, BackgroundTasks, Depends, FastAPI, Query, HTTPException, Request, Response
+from typing import Any, Awaitable, Callable, Dict, Optional, Literal
 from datetime import datetime
+from collections import OrderedDict
+import asyncio
 import logging
+import time
+
+import orjson
 
 from app.integrations.esa_client import (
     get_fallback_manager,
@@ -16,31 +21,171 @@ from app.integrations.esa_client import (
 router = APIRouter(prefix="/api/v1/data-sources", tags=["data-sources"])
 logger = logging.getLogger(__name__)
 
+# NEO datasets change over hours/days, so upstream responses are cached in-process
+NEO_CACHE_TTL_SECONDS = 300
+PRIORITY_LIST_CACHE_TTL_SECONDS = 900
+STATUS_CACHE_TTL_SECONDS = 30
+
+# Cache keys come from public query parameters, so the cache is bounded (LRU)
+# and min_distance_au is quantized to this many decimals (0.001 AU ~ 150,000 km)
+RESPONSE_CACHE_MAX_ENTRIES = 128
+MIN_DISTANCE_AU_DECIMALS = 3
+
+# /health serves the last probe result; after REFRESH it is re-probed in the
+# background, after TTL the caller waits for a fresh probe
+HEALTH_CACHE_TTL_SECONDS = 10
+HEALTH_REFRESH_AFTER_SECONDS = 5
+
+FORCE_REFRESH_QUERY = Query(False, description="Bypass the response cache and query the upstream source")
+
+
+def _app_manager(app: FastAPI) -> CelestialDataFallbackManager:
+    """Get the fallback manager stored on app state (set during lifespan startup)"""
+    manager = getattr(app.state, "fallback_manager", None)
+    if manager is None:
+        manager = app.state.fallback_manager = get_fallback_manager()
+    return manager
+
+
+def get_manager(request: Request) -> CelestialDataFallbackManager:
+    """Dependency resolving the fallback manager for a request"""
+    return _app_manager(request.app)
+
+
+def _response_cache(app: FastAPI) -> "OrderedDict[tuple, tuple[float, bytes]]":
+    """Get the {key: (expiry_ts, encoded_body)} response cache stored on app state, oldest use first"""
+    cache = getattr(app.state, "data_source_cache", None)
+    if cache is None:
+        cache = app.state.data_source_cache = OrderedDict()
+    return cache
+
+
+async def _cached(
+    app: FastAPI,
+    key: tuple,
+    ttl: int,
+    loader: Callable[[], Awaitable[Dict[str, Any]]],
+    force_refresh: bool = False,
+) -> bytes:
+    """
+    Serve an encoded JSON body from the response cache, calling loader on a miss or expiry
+    
+    The payload is encoded once when it is cached, so hits return the stored
+    bytes as-is. Exceptions raised by loader or by encoding propagate (inside
+    the caller's error handling) and are never cached.
+    
+    Each insert drops expired entries, then the least recently used ones
+    beyond RESPONSE_CACHE_MAX_ENTRIES.
+    """
+    cache = _response_cache(app)
+    entry = cache.get(key)
+    
+    if entry is not None and not force_refresh and entry[0] > time.monotonic():
+        cache.move_to_end(key)
+        return entry[1]
+    
+    body = orjson.dumps(await loader())
+    
+    now = time.monotonic()
+    for expired in [k for k, (expiry, _) in cache.items() if expiry <= now]:
+        del cache[expired]
+    cache[key] = (now + ttl, body)
+    cache.move_to_end(key)
+    while len(cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return body
+
+
+def _cache_headers(ttl: int) -> Dict[str, str]:
+    """Let browsers and CDNs reuse the response for the same TTL as the server cache"""
+    return {"Cache-Control": f"public, max-age={ttl}"}
+
+
+def _json_response(body: bytes, ttl: int) -> Response:
+    """Send a pre-encoded JSON body with Cache-Control matching the server cache TTL"""
+    return Response(content=body, media_type="application/json", headers=_cache_headers(ttl))
+
+
+def _refresh_status(app: FastAPI) -> bytes:
+    """Re-encode the /status body from the manager's current availability flags"""
+    body = orjson.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "sources": _app_manager(app).get_source_status(),
+        "message": "Data source status retrieved successfully"
+    })
+    app.state.data_source_status = body
+    return body
+
+
+async def refresh_status_periodically(app: FastAPI) -> None:
+    """
+    Keep the encoded /status body current
+    
+    Started as a background task by the application lifespan, so /status
+    requests only ever read pre-encoded bytes off app state.
+    """
+    while True:
+        try:
+            _refresh_status(app)
+        except Exception as e:
+            logger.warning(f"Could not refresh data source status: {e}")
+        await asyncio.sleep(STATUS_CACHE_TTL_SECONDS)
+
+
+async def warm_data_source_cache(app: FastAPI) -> None:
+    """
+    Preload the response cache with each endpoint's default query
+    
+    Started as a background task by the application lifespan, so startup
+    never waits on NASA/ESA while the first requests after a deploy are
+    still likely to be served from memory. The loaders run concurrently.
+    """
+    manager = _app_manager(app)
+    loaders = (
+        (("neo-objects", 100, "AUTO"), NEO_CACHE_TTL_SECONDS,
+         lambda: _fetch_neo_objects(manager, 100, "AUTO")),
+        (("close-approaches", 30, 0.05, "AUTO"), NEO_CACHE_TTL_SECONDS,
+         lambda: _fetch_close_approaches(manager, 30, 0.05, "AUTO")),
+        (("esa-priority-list", 100), PRIORITY_LIST_CACHE_TTL_SECONDS,
+         lambda: _fetch_esa_priority_list(manager, 100)),
+    )
+    
+    async def preload(key: tuple, ttl: int, loader: Callable[[], Awaitable[Dict[str, Any]]]) -> None:
+        try:
+            await _cached(app, key, ttl, loader, force_refresh=True)
+        except Exception as e:
+            logger.warning(f"Could not preload {key[0]} cache: {e}")
+    
+    await asyncio.gather(*(preload(key, ttl, loader) for key, ttl, loader in loaders))
+
 
 @router.get("/status")
-async def get_data_source_status():
+async def get_data_source_status(
+    request: Request,
+    force_refresh: bool = FORCE_REFRESH_QUERY,
+):
     """
     Get current status of all celestial data sources (NASA/ESA)
     
     Returns information about which sources are online and which is currently active
     """
-    manager = get_fallback_manager()
-    status = manager.get_source_status()
+    body = getattr(request.app.state, "data_source_status", None)
+    if body is None or force_refresh:
+        body = _refresh_status(request.app)
     
-    return {
-        "timestamp": datetime.now().isoformat(),
-        "sources": status,
-        "message": "Data source status retrieved successfully"
-    }
+    return _json_response(body, STATUS_CACHE_TTL_SECONDS)
 
 
 @router.get("/neo-objects")
 async def get_neo_objects(
+    request: Request,
     limit: int = Query(100, ge=1, le=1000, description="Number of NEO objects to fetch"),
     source: Optional[Literal["NASA", "ESA", "AUTO"]] = Query(
         "AUTO",
         description="Data source to use (AUTO will attempt NASA first, fall back to ESA)"
-    )
+    ),
+    force_refresh: bool = FORCE_REFRESH_QUERY,
+    manager: CelestialDataFallbackManager = Depends(get_manager),
 ):
     """
     Fetch Near-Earth Object data with automatic NASA/ESA fallback
@@ -48,28 +193,20 @@ async def get_neo_objects(
     Args:
         limit: Number of objects to return
         source: Preferred data source (AUTO, NASA, or ESA)
+        force_refresh: Bypass the response cache
     
     Returns:
         List of NEO objects with orbital elements and risk data
     """
     try:
-        manager = get_fallback_manager()
-        
-        force_source = None if source == "AUTO" else source
-        neo_data, source_used = manager.get_neo_data(limit=limit, force_source=force_source)
-        
-        if not neo_data and source_used == 'NONE':
-            raise HTTPException(
-                status_code=503,
-                detail="All data sources (NASA and ESA) are currently unavailable"
-            )
-        
-        return {
-            "total": len(neo_data),
-            "source": source_used,
-            "data": neo_data,
-            "message": f"Successfully fetched NEO data from {source_used}"
-        }
+        body = await _cached(
+            request.app,
+            ("neo-objects", limit, source),
+            NEO_CACHE_TTL_SECONDS,
+            lambda: _fetch_neo_objects(manager, limit, source),
+            force_refresh,
+        )
+        return _json_response(body, NEO_CACHE_TTL_SECONDS)
     
     except Exception as e:
         logger.error(f"Error fetching NEO objects: {e}")
@@ -78,12 +215,15 @@ async def get_neo_objects(
 
 @router.get("/close-approaches")
 async def get_close_approaches(
+    request: Request,
     days_forward: int = Query(30, ge=1, le=365, description="Number of days to look ahead"),
     min_distance_au: float = Query(0.05, ge=0.0, le=1.0, description="Minimum approach distance in AU"),
     source: Optional[Literal["NASA", "ESA", "AUTO"]] = Query(
         "AUTO",
         description="Data source to use"
-    )
+    ),
+    force_refresh: bool = FORCE_REFRESH_QUERY,
+    manager: CelestialDataFallbackManager = Depends(get_manager),
 ):
     """
     Fetch upcoming close approach events with automatic NASA/ESA fallback
@@ -92,36 +232,23 @@ async def get_close_approaches(
         days_forward: Number of days to look ahead
         min_distance_au: Minimum approach distance threshold
         source: Preferred data source
+        force_refresh: Bypass the response cache
     
     Returns:
         List of close approach events
     """
+    # Nearby thresholds share one cache entry (and one upstream query)
+    min_distance_au = round(min_distance_au, MIN_DISTANCE_AU_DECIMALS)
+    
     try:
-        manager = get_fallback_manager()
-        
-        force_source = None if source == "AUTO" else source
-        approaches, source_used = manager.get_close_approaches(
-            days_forward=days_forward,
-            force_source=force_source
+        body = await _cached(
+            request.app,
+            ("close-approaches", days_forward, min_distance_au, source),
+            NEO_CACHE_TTL_SECONDS,
+            lambda: _fetch_close_approaches(manager, days_forward, min_distance_au, source),
+            force_refresh,
         )
-        
-        # Filter by minimum distance if ESA data includes closer approaches
-        if min_distance_au > 0:
-            approaches = [
-                ca for ca in approaches 
-                if ca.get('distance_au', float('inf')) >= min_distance_au
-            ]
-        
-        return {
-            "total": len(approaches),
-            "source": source_used,
-            "parameters": {
-                "days_forward": days_forward,
-                "min_distance_au": min_distance_au
-            },
-            "data": approaches,
-            "message": f"Found {len(approaches)} close approaches from {source_used}"
-        }
+        return _json_response(body, NEO_CACHE_TTL_SECONDS)
     
     except Exception as e:
         logger.error(f"Error fetching close approaches: {e}")
@@ -134,7 +261,8 @@ async def get_object_by_name(
     source: Optional[Literal["NASA", "ESA", "AUTO"]] = Query(
         "AUTO",
         description="Data source to use"
-    )
+    ),
+    manager: CelestialDataFallbackManager = Depends(get_manager),
 ):
     """
     Fetch specific celestial object by name or designation
@@ -147,10 +275,8 @@ async def get_object_by_name(
         Object data with orbital elements
     """
     try:
-        manager = get_fallback_manager()
-        
         force_source = None if source == "AUTO" else source
-        obj_data, source_used = manager.get_object_by_name(
+        obj_data, source_used = await manager.get_object_by_name(
             object_name=object_name,
             force_source=force_source
         )
@@ -176,7 +302,9 @@ async def get_object_by_name(
 
 @router.post("/switch-source")
 async def switch_primary_source(
-    source: Literal["NASA", "ESA"]
+    request: Request,
+    source: Literal["NASA", "ESA"],
+    manager: CelestialDataFallbackManager = Depends(get_manager),
 ):
     """
     Manually switch the primary data source
@@ -188,15 +316,15 @@ async def switch_primary_source(
         Updated source status
     """
     try:
-        manager = get_fallback_manager()
+        manager.set_primary_source(source)
+        message = (
+            "Switched primary source to NASA JPL" if source == "NASA"
+            else "Switched primary source to ESA NEOCC"
+        )
         
-        if source == "NASA":
-            manager.nasa_available = True
-            manager.primary_source = "NASA"
-            message = "Switched primary source to NASA JPL"
-        else:
-            manager.primary_source = "ESA"
-            message = "Switched primary source to ESA NEOCC"
+        # Cached payloads were produced under the previous primary source
+        _response_cache(request.app).clear()
+        _refresh_status(request.app)
         
         status = manager.get_source_status()
         
@@ -212,7 +340,10 @@ async def switch_primary_source(
 
 @router.get("/esa/priority-list")
 async def get_esa_priority_list(
-    limit: int = Query(100, ge=1, le=500, description="Number of objects to fetch")
+    request: Request,
+    limit: int = Query(100, ge=1, le=500, description="Number of objects to fetch"),
+    force_refresh: bool = FORCE_REFRESH_QUERY,
+    manager: CelestialDataFallbackManager = Depends(get_manager),
 ):
     """
     Direct access to ESA NEOCC priority list
@@ -222,26 +353,20 @@ async def get_esa_priority_list(
     
     Args:
         limit: Number of priority objects to return
+        force_refresh: Bypass the response cache
     
     Returns:
         ESA's current priority list of NEOs
     """
     try:
-        esa_client = ESANEOClient()
-        priority_objects = esa_client.get_priority_objects(limit=limit)
-        
-        if not priority_objects:
-            raise HTTPException(
-                status_code=503,
-                detail="ESA NEOCC service is currently unavailable"
-            )
-        
-        return {
-            "total": len(priority_objects),
-            "source": "ESA NEOCC",
-            "data": priority_objects,
-            "message": f"Fetched {len(priority_objects)} priority NEOs from ESA"
-        }
+        body = await _cached(
+            request.app,
+            ("esa-priority-list", limit),
+            PRIORITY_LIST_CACHE_TTL_SECONDS,
+            lambda: _fetch_esa_priority_list(manager, limit),
+            force_refresh,
+        )
+        return _json_response(body, PRIORITY_LIST_CACHE_TTL_SECONDS)
     
     except HTTPException:
         raise
@@ -251,20 +376,53 @@ async def get_esa_priority_list(
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(request: Request, background_tasks: BackgroundTasks):
     """
     Health check endpoint for data source connectivity
     
-    Tests both NASA and ESA endpoints and returns availability status
+    Tests both NASA and ESA endpoints concurrently and returns availability status.
+    Results are served stale-while-revalidate so callers never queue behind the
+    probes while a recent result exists.
     """
-    manager = get_fallback_manager()
+    app = request.app
+    entry = getattr(app.state, "data_source_health", None)
+    age = time.monotonic() - entry[0] if entry is not None else None
     
-    # Test ESA
-    esa_client = ESANEOClient()
-    esa_test = len(esa_client.get_priority_objects(limit=1)) > 0
+    if age is None or age >= HEALTH_CACHE_TTL_SECONDS:
+        return await _refresh_health(app)
     
-    # NASA test (would check actual NASA endpoints in production)
-    nasa_test = False  # Simulating shutdown
+    if age >= HEALTH_REFRESH_AFTER_SECONDS and not getattr(app.state, "data_source_health_refreshing", False):
+        app.state.data_source_health_refreshing = True
+        background_tasks.add_task(_refresh_health_in_background, app)
+    
+    return entry[1]
+
+
+async def _refresh_health(app: FastAPI) -> Dict[str, Any]:
+    """Probe both sources and store the result as the last-known health"""
+    try:
+        payload = await _probe_health(_app_manager(app))
+        app.state.data_source_health = (time.monotonic(), payload)
+        return payload
+    finally:
+        app.state.data_source_health_refreshing = False
+
+
+async def _refresh_health_in_background(app: FastAPI) -> None:
+    """Background revalidation - a failed probe keeps the previous result"""
+    try:
+        await _refresh_health(app)
+    except Exception as e:
+        logger.warning(f"Background health probe failed: {e}")
+
+
+async def _probe_health(manager: CelestialDataFallbackManager) -> Dict[str, Any]:
+    """Run the NASA and ESA probes concurrently and build the /health payload"""
+    esa_client = manager.esa_neo_client
+    nasa_test, esa_test = await asyncio.gather(
+        _probe_nasa(),
+        _probe_esa(esa_client),
+    )
     
     return {
         "status": "healthy" if (esa_test or nasa_test) else "degraded",
@@ -281,3 +439,74 @@ async def health_check():
         "active_source": "ESA NEOCC" if esa_test and not nasa_test else "NASA JPL" if nasa_test else "NONE",
         "timestamp": datetime.now().isoformat()
     }
+
+
+async def _probe_nasa() -> bool:
+    """NASA test (would check actual NASA endpoints in production)"""
+    return False  # Simulating shutdown
+
+
+async def _probe_esa(esa_client: ESANEOClient) -> bool:
+    """ESA test - a single priority object proves the NEOCC feed is reachable"""
+    return len(await esa_client.get_priority_objects(limit=1)) > 0
+
+
+async def _fetch_neo_objects(manager: CelestialDataFallbackManager, limit: int, source: str) -> Dict[str, Any]:
+    """Query NEO objects upstream and build the /neo-objects payload"""
+    force_source = None if source == "AUTO" else source
+    neo_data, source_used = await manager.get_neo_data(limit=limit, force_source=force_source)
+    
+    if not neo_data and source_used == 'NONE':
+        raise HTTPException(
+            status_code=503,
+            detail="All data sources (NASA and ESA) are currently unavailable"
+        )
+    
+    return {
+        "total": len(neo_data),
+        "source": source_used,
+        "data": neo_data,
+        "message": f"Successfully fetched NEO data from {source_used}"
+    }
+
+
+async def _fetch_close_approaches(
+    manager: CelestialDataFallbackManager, days_forward: int, min_distance_au: float, source: str
+) -> Dict[str, Any]:
+    """Query close approaches upstream and build the /close-approaches payload"""
+    force_source = None if source == "AUTO" else source
+    approaches, source_used = await manager.get_close_approaches(
+        days_forward=days_forward,
+        min_distance_au=min_distance_au,
+        force_source=force_source
+    )
+    
+    return {
+        "total": len(approaches),
+        "source": source_used,
+        "parameters": {
+            "days_forward": days_forward,
+            "min_distance_au": min_distance_au
+        },
+        "data": approaches,
+        "message": f"Found {len(approaches)} close approaches from {source_used}"
+    }
+
+
+async def _fetch_esa_priority_list(manager: CelestialDataFallbackManager, limit: int) -> Dict[str, Any]:
+    """Query the ESA NEOCC priority list and build the /esa/priority-list payload"""
+    esa_client = manager.esa_neo_client
+    priority_objects = await esa_client.get_priority_objects(limit=limit)
+    
+    if not priority_objects:
+        raise HTTPException(
+            status_code=503,
+            detail="ESA NEOCC service is currently unavailable"
+        )
+    
+    return {
+        "total": len(priority_objects),
+        "source": "ESA NEOCC",
+        "data": priority_objects,
+        "message": f"Fetched {len(priority_objects)} priority NEOs from ESA"
+    }
@@ -164,13 +164,10 @@ async def seismos_correlation(request: SeismosCorrelationRequest):
     - Target thresholds and model confidence
     """
     try:
-        # Initialize Seismos correlation trainer
-        seismos_trainer = SeismosCorrelationTrainer()
-        
-        # Load trained models
+        # Load trained models (cached across requests)
         models_dir = "app/models/"
         try:
-            seismos_trainer.load_models(models_dir)
+            seismos_trainer = SeismosCorrelationTrainer.load_from_disk(models_dir)
         except FileNotFoundError:
             raise HTTPException(
                 status_code=503,
@@ -367,7 +367,7 @@ async def get_tetrad_history(
     # Filter by year range
     filtered = [
         t for t in tetrads
-        if start_year <= int(t["period"].split("-")[0]) <= end_year
+        if start_year <= int(t["period"][:4]) <= end_year
     ]
     
     return {
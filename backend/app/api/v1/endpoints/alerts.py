@@ -3,6 +3,7 @@ Alert system endpoints (data triggers, alerts).
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -16,6 +17,10 @@ from app.schemas.alerts import (
 
 router = APIRouter()
 
+# List responses are validated in one pass through pydantic-core instead of per row
+_DATA_TRIGGERS_ADAPTER = TypeAdapter(list[DataTriggersResponse])
+_ALERTS_ADAPTER = TypeAdapter(list[AlertsResponse])
+
 
 @router.get("/data-triggers", response_model=PaginatedDataTriggersResponse, tags=["data triggers"])
 def get_data_triggers(
@@ -50,7 +55,7 @@ def get_data_triggers(
         total=total,
         skip=skip,
         limit=limit,
-        data=[DataTriggersResponse.model_validate(r) for r in records]
+        data=_DATA_TRIGGERS_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -87,5 +92,5 @@ def get_alerts(
         total=total,
         skip=skip,
         limit=limit,
-        data=[AlertsResponse.model_validate(r) for r in records]
+        data=_ALERTS_ADAPTER.validate_python(records, from_attributes=True)
     )
@@ -3,7 +3,8 @@ Correlation analysis endpoints (correlation rules, event correlations).
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session, load_only
 
 from app.db.session import get_db
 from app.models.correlations import CorrelationRules, EventCorrelations
@@ -16,6 +17,14 @@ from app.schemas.correlations import (
 
 router = APIRouter()
 
+# List responses are validated in one pass through pydantic-core instead of per row
+_CORRELATION_RULES_ADAPTER = TypeAdapter(list[CorrelationRulesResponse])
+_EVENT_CORRELATIONS_ADAPTER = TypeAdapter(list[EventCorrelationsResponse])
+
+# List endpoints select only the columns their response schema serializes
+_CORRELATION_RULE_COLUMNS = [getattr(CorrelationRules, f) for f in CorrelationRulesResponse.model_fields]
+_EVENT_CORRELATION_COLUMNS = [getattr(EventCorrelations, f) for f in EventCorrelationsResponse.model_fields]
+
 
 @router.get("/correlation-rules", response_model=PaginatedCorrelationRulesResponse, tags=["correlation rules"])
 def get_correlation_rules(
@@ -33,7 +42,7 @@ def get_correlation_rules(
     - X-class solar flare → M7.5+ earthquake within 72 hours
     - Asteroid close approach → Increased seismic activity within 7 days
     """
-    query = db.query(CorrelationRules)
+    query = db.query(CorrelationRules).options(load_only(*_CORRELATION_RULE_COLUMNS))
     
     if is_active is not None:
         query = query.filter(CorrelationRules.is_active == is_active)
@@ -51,7 +60,7 @@ def get_correlation_rules(
         total=total,
         skip=skip,
         limit=limit,
-        data=[CorrelationRulesResponse.model_validate(r) for r in records]
+        data=_CORRELATION_RULES_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -74,7 +83,7 @@ def get_event_correlations(
     - Asteroid approaches correlating with volcanic activity
     - Lunar cycles and geophysical events
     """
-    query = db.query(EventCorrelations)
+    query = db.query(EventCorrelations).options(load_only(*_EVENT_CORRELATION_COLUMNS))
     
     if rule_id is not None:
         query = query.filter(EventCorrelations.rule_id == rule_id)
@@ -95,5 +104,5 @@ def get_event_correlations(
         total=total,
         skip=skip,
         limit=limit,
-        data=[EventCorrelationsResponse.model_validate(r) for r in records]
+        data=_EVENT_CORRELATIONS_ADAPTER.validate_python(records, from_attributes=True)
     )
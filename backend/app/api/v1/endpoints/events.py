@@ -3,6 +3,7 @@ Geophysical events endpoints (earthquakes, solar events, meteor showers, volcani
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 # Removed geoalchemy2 and shapely - using direct lat/lon columns now
 
@@ -21,6 +22,10 @@ from app.schemas.events import (
 
 router = APIRouter()
 
+# List responses are validated in one pass through pydantic-core instead of per row
+_SOLAR_EVENTS_ADAPTER = TypeAdapter(list[SolarEventsResponse])
+_METEOR_SHOWERS_ADAPTER = TypeAdapter(list[MeteorShowersResponse])
+
 
 @router.get("/earthquakes", response_model=PaginatedEarthquakesResponse, tags=["earthquakes"])
 def get_earthquakes(
@@ -97,7 +102,7 @@ def get_solar_events(
         total=total,
         skip=skip,
         limit=limit,
-        data=[SolarEventsResponse.model_validate(r) for r in records]
+        data=_SOLAR_EVENTS_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -129,7 +134,7 @@ def get_meteor_showers(
         total=total,
         skip=skip,
         limit=limit,
-        data=[MeteorShowersResponse.model_validate(r) for r in records]
+        data=_METEOR_SHOWERS_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -5,6 +5,7 @@ Seismos (σεισμός) expansion: Matthew 24:7, Revelation 6:12 - "commotion o
 """
 from typing import Optional
 from fastapi import APIRouter, Depends, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 
@@ -34,6 +35,12 @@ from app.schemas.events import (
 
 router = APIRouter()
 
+# List responses are validated in one pass through pydantic-core instead of per row
+_EPHEMERIS_DATA_ADAPTER = TypeAdapter(list[EphemerisDataResponse])
+_ORBITAL_ELEMENTS_ADAPTER = TypeAdapter(list[OrbitalElementsResponse])
+_IMPACT_RISKS_ADAPTER = TypeAdapter(list[ImpactRisksResponse])
+_NEO_CLOSE_APPROACHES_ADAPTER = TypeAdapter(list[NeoCloseApproachesResponse])
+
 
 @router.get("/ephemeris", response_model=PaginatedEphemerisResponse, tags=["ephemeris"])
 def get_ephemeris_data(
@@ -66,7 +73,7 @@ def get_ephemeris_data(
         total=total,
         skip=skip,
         limit=limit,
-        data=[EphemerisDataResponse.model_validate(r) for r in records]
+        data=_EPHEMERIS_DATA_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -107,7 +114,7 @@ def get_orbital_elements(
                 total=total,
                 skip=skip,
                 limit=limit,
-                data=[OrbitalElementsResponse.model_validate(r) for r in records]
+                data=_ORBITAL_ELEMENTS_ADAPTER.validate_python(records, from_attributes=True)
             )
         finally:
             db.close()
@@ -153,7 +160,7 @@ def get_impact_risks(
         total=total,
         skip=skip,
         limit=limit,
-        data=[ImpactRisksResponse.model_validate(r) for r in records]
+        data=_IMPACT_RISKS_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
@@ -185,7 +192,7 @@ def get_close_approaches(
         total=total,
         skip=skip,
         limit=limit,
-        data=[NeoCloseApproachesResponse.model_validate(r) for r in records]
+        data=_NEO_CLOSE_APPROACHES_ADAPTER.validate_python(records, from_attributes=True)
     )
 
 
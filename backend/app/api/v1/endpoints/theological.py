@@ -1,8 +1,14 @@
 """
 Theological endpoints (prophecies, celestial signs, prophecy-sign links, feast days).
 """
+import hashlib
+import time
+from itertools import combinations
 from typing import Optional, List
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, bindparam, func, select, text
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -16,11 +22,149 @@ from app.schemas.theological import (
     PaginatedProphecySignLinksResponse
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Prophecies, signs and links are reference data - let clients revalidate with ETags
+CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+# Row-version fingerprint: xmin is the id of the transaction that inserted or
+# last updated a row, so any committed insert, update or delete changes the
+# row count or the xmin sum. Unlike the pg_stat counters it is exact and
+# unaffected by statistics resets. None of these tables has an updated_at column.
+_TABLE_VERSION_SQL = {
+    table: text(f"SELECT count(*), coalesce(sum(xmin::text::bigint), 0) FROM {table}")
+    for table in (
+        Prophecies.__tablename__,
+        CelestialSigns.__tablename__,
+        ProphecySignLinks.__tablename__,
+    )
+}
+
+# The fingerprint is cached in-process, so repeat requests (and every 304)
+# inside the TTL never touch the database. Writes show up within the TTL,
+# well inside the max-age clients are already allowed to reuse a response for.
+TABLE_VERSION_TTL_SECONDS = 30
+_table_versions: dict[str, tuple[float, str]] = {}
+
+
+def _table_version(db: Session, table: str) -> str:
+    """
+    Get the table's row-version fingerprint, re-read from Postgres at most
+    every TABLE_VERSION_TTL_SECONDS.
+    """
+    now = time.monotonic()
+    cached = _table_versions.get(table)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    row_count, xmin_sum = db.execute(_TABLE_VERSION_SQL[table]).one()
+    version = f"{row_count}.{xmin_sum}"
+    _table_versions[table] = (now + TABLE_VERSION_TTL_SECONDS, version)
+    return version
+
+
+def _etag(db: Session, model: type, filters: dict, skip: int, limit: int) -> str:
+    """Build a strong ETag from the table version and the page parameters"""
+    filter_hash = hashlib.md5(repr(sorted(filters.items())).encode()).hexdigest()[:12]
+    return f'"{_table_version(db, model.__tablename__)}-{skip}-{limit}-{filter_hash}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds this ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return None
+    
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    return None
+
+
+def _page_statements(
+    model: type, schema: type[BaseModel], order_by: tuple, filters: dict
+) -> dict[frozenset, tuple[Select, Select]]:
+    """
+    Build (page, count) SELECTs for every combination of optional filters.
+    
+    Filter values, skip and limit are named bind parameters, so each
+    statement is constructed once at import and hits the compiled-SQL
+    cache on every request.
+    
+    Pages select only the response schema's columns rather than the ORM
+    entity: rows from the database already satisfy the schema, so they go
+    to orjson as plain dicts without building mapped instances, per-row
+    Pydantic validation or jsonable_encoder. response_model stays on the
+    routes for the OpenAPI docs.
+    """
+    columns = [getattr(model, field) for field in schema.model_fields]
+    statements = {}
+    for n in range(len(filters) + 1):
+        for names in combinations(filters, n):
+            clauses = [filters[name] for name in names]
+            page = (
+                select(*columns, func.count().over().label("total"))
+                .where(*clauses)
+                .order_by(*order_by)
+                .offset(bindparam("skip"))
+                .limit(bindparam("limit"))
+            )
+            count = select(func.count()).select_from(model).where(*clauses)
+            statements[frozenset(names)] = (page, count)
+    return statements
+
+
+_PROPHECY_PAGES = _page_statements(
+    Prophecies,
+    PropheciesResponse,
+    (Prophecies.chronological_order.nullslast(), Prophecies.id),
+    {
+        "category": Prophecies.prophecy_category == bindparam("category"),
+        "event_name": Prophecies.event_name.ilike(bindparam("event_name")),
+    },
+)
+
+_CELESTIAL_SIGN_PAGES = _page_statements(
+    CelestialSigns,
+    CelestialSignsResponse,
+    (CelestialSigns.sign_name,),
+    {
+        "sign_type": CelestialSigns.sign_type == bindparam("sign_type"),
+        "sign_name": CelestialSigns.sign_name.ilike(bindparam("sign_name")),
+    },
+)
+
+_PROPHECY_SIGN_LINK_PAGES = _page_statements(
+    ProphecySignLinks,
+    ProphecySignLinksResponse,
+    (ProphecySignLinks.prophecy_id, ProphecySignLinks.sign_id),
+    {
+        "prophecy_id": ProphecySignLinks.prophecy_id == bindparam("prophecy_id"),
+        "sign_id": ProphecySignLinks.sign_id == bindparam("sign_id"),
+    },
+)
+
+
+def _paginate(db: Session, statements: dict, filters: dict, skip: int, limit: int) -> tuple[int, list[dict]]:
+    """
+    Fetch one page and the unpaginated total in a single round-trip.
+    
+    The total rides along on every row as COUNT(*) OVER (), which the
+    database evaluates before OFFSET/LIMIT are applied. filters holds only
+    the active filters, keyed by bind parameter name.
+    """
+    page, count = statements[frozenset(filters)]
+    rows = db.execute(page, {**filters, "skip": skip, "limit": limit}).all()
+    if rows:
+        fields = rows[0]._fields[:-1]  # every selected column but "total"
+        return rows[0].total, [dict(zip(fields, row)) for row in rows]
+    # Past the last page there is no row to carry the total
+    return (db.execute(count, filters).scalar_one() if skip else 0), []
 
 
 @router.get("/prophecies", response_model=PaginatedPropheciesResponse, tags=["prophecies"])
 def get_prophecies(
+    request: Request,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=1000, description="Number of records to return"),
     category: Optional[str] = Query(None, description="Filter by prophecy category"),
@@ -33,27 +177,32 @@ def get_prophecies(
     Returns prophecy records from books like Revelation, Isaiah, Joel, Zechariah
     with categorization and chronological ordering.
     """
-    query = db.query(Prophecies)
+    filters = {}
     
     if category:
-        query = query.filter(Prophecies.prophecy_category == category)
+        filters["category"] = category
     
     if event_name:
-        query = query.filter(Prophecies.event_name.ilike(f"%{event_name}%"))
+        filters["event_name"] = f"%{event_name}%"
     
-    total = query.count()
-    records = query.order_by(Prophecies.chronological_order.nullslast(), Prophecies.id).offset(skip).limit(limit).all()
+    etag = _etag(db, Prophecies, filters, skip, limit)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     
-    return PaginatedPropheciesResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        data=[PropheciesResponse.model_validate(r) for r in records]
-    )
+    total, records = _paginate(db, _PROPHECY_PAGES, filters, skip, limit)
+    
+    return ORJSONResponse({
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "data": records,
+    }, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
 
 
 @router.get("/celestial-signs", response_model=PaginatedCelestialSignsResponse, tags=["celestial signs"])
 def get_celestial_signs(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
     sign_type: Optional[str] = Query(None, description="Filter by sign type (COSMIC, TERRESTRIAL, ATMOSPHERIC, etc.)"),
@@ -66,27 +215,32 @@ def get_celestial_signs(
     Returns prophetic signs that can be correlated with astronomical/geophysical events
     including scripture references and theological significance.
     """
-    query = db.query(CelestialSigns)
+    filters = {}
     
     if sign_type:
-        query = query.filter(CelestialSigns.sign_type == sign_type)
+        filters["sign_type"] = sign_type
     
     if sign_name:
-        query = query.filter(CelestialSigns.sign_name.ilike(f"%{sign_name}%"))
+        filters["sign_name"] = f"%{sign_name}%"
     
-    total = query.count()
-    records = query.order_by(CelestialSigns.sign_name).offset(skip).limit(limit).all()
+    etag = _etag(db, CelestialSigns, filters, skip, limit)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     
-    return PaginatedCelestialSignsResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        data=[CelestialSignsResponse.model_validate(r) for r in records]
-    )
+    total, records = _paginate(db, _CELESTIAL_SIGN_PAGES, filters, skip, limit)
+    
+    return ORJSONResponse({
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "data": records,
+    }, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
 
 
 @router.get("/prophecy-sign-links", response_model=PaginatedProphecySignLinksResponse, tags=["prophecy-sign links"])
 def get_prophecy_sign_links(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=1000),
     prophecy_id: Optional[int] = Query(None, description="Filter by prophecy ID"),
@@ -98,23 +252,27 @@ def get_prophecy_sign_links(
     
     Shows relationships between biblical prophecies and their associated signs.
     """
-    query = db.query(ProphecySignLinks)
+    filters = {}
     
     if prophecy_id is not None:
-        query = query.filter(ProphecySignLinks.prophecy_id == prophecy_id)
+        filters["prophecy_id"] = prophecy_id
     
     if sign_id is not None:
-        query = query.filter(ProphecySignLinks.sign_id == sign_id)
+        filters["sign_id"] = sign_id
     
-    total = query.count()
-    records = query.order_by(ProphecySignLinks.prophecy_id, ProphecySignLinks.sign_id).offset(skip).limit(limit).all()
+    etag = _etag(db, ProphecySignLinks, filters, skip, limit)
+    not_modified = _not_modified(request, etag)
+    if not_modified is not None:
+        return not_modified
     
-    return PaginatedProphecySignLinksResponse(
-        total=total,
-        skip=skip,
-        limit=limit,
-        data=[ProphecySignLinksResponse.model_validate(r) for r in records]
-    )
+    total, records = _paginate(db, _PROPHECY_SIGN_LINK_PAGES, filters, skip, limit)
+    
+    return ORJSONResponse({
+        "total": total,
+        "skip": skip,
+        "limit": limit,
+        "data": records,
+    }, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
 
 
 @router.get("/feasts", tags=["feasts"])
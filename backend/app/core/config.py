@@ -62,6 +62,13 @@ class Settings(BaseSettings):
                 # If parsing fails, keep defaults
                 pass
     
+    # Uvicorn worker processes; railway-start.sh exports the count it starts
+    WEB_CONCURRENCY: int = 1
+    
+    # Postgres connections the whole service may hold, split evenly across the
+    # workers. Keep it below the server's max_connections (100 by default).
+    DB_MAX_CONNECTIONS: int = 50
+    
     # Pagination defaults
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 1000
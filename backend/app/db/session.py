@@ -2,6 +2,7 @@
 
 from typing import Generator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.core.config import settings
@@ -9,20 +10,38 @@ from app.core.config import settings
 # Create SQLAlchemy engine lazily with Railway-compatible connection
 _engine = None
 
+# Longest a statement may run before Postgres cancels it. Set once per
+# connection through libpq, so it costs no extra round-trips; scripts that
+# build indexes lift it with SET LOCAL statement_timeout = 0.
+STATEMENT_TIMEOUT_MS = 5000
+
+# Every uvicorn worker builds its own engine, so each gets an equal share of
+# DB_MAX_CONNECTIONS: half as the steady pool, half as burst overflow
+_WORKERS = max(settings.WEB_CONCURRENCY, 1)
+POOL_SIZE = max(settings.DB_MAX_CONNECTIONS // (2 * _WORKERS), 1)
+MAX_OVERFLOW = max(settings.DB_MAX_CONNECTIONS // (2 * _WORKERS), 1)
+
 def get_engine():
     """Get or create SQLAlchemy engine with Railway-compatible DATABASE_URL"""
     global _engine
     if _engine is None:
         # Get DATABASE_URL with correct dialect (postgresql+psycopg2://)
         database_url = settings.SQLALCHEMY_DATABASE_URL
+        # statement_timeout is a libpq startup option, so only pass it to Postgres
+        connect_args = {}
+        if make_url(database_url).get_backend_name() == "postgresql":
+            connect_args["options"] = f"-c statement_timeout={STATEMENT_TIMEOUT_MS}"
         print(f"Connecting to database: {database_url.split('@')[1] if '@' in database_url else 'localhost'}")  # Log host only, not credentials
         _engine = create_engine(
             database_url,
             pool_pre_ping=True,  # Verify connections before using
-            pool_recycle=300,    # Recycle connections after 5 minutes
-            pool_size=20,        # Increase from default 5 to 20 for production
-            max_overflow=40,     # Increase from default 10 to 40 for burst traffic
+            pool_recycle=1800,   # Recycle connections after 30 minutes
+            pool_size=POOL_SIZE,        # This worker's share of DB_MAX_CONNECTIONS
+            max_overflow=MAX_OVERFLOW,  # Burst headroom, also counted in the share
             pool_timeout=60,     # Increase timeout from 30s to 60s
+            pool_use_lifo=True,  # Reuse the most recently returned (warm) connection first
+            connect_args=connect_args,  # Abort statements running longer than 5s
+            query_cache_size=1200,  # Compiled-SQL LRU (default 500) - one entry per endpoint filter combination
             echo=False
         )
     return _engine
@@ -11,13 +11,100 @@ This module provides a resilient data fetching system with automatic fallback
 from NASA JPL to ESA sources.
 """
 
-import requests
-from typing import List, Dict, Optional
+import httpx
+from typing import Any, Awaitable, Callable, List, Dict, Optional
 from datetime import datetime, timedelta
+import asyncio
+import functools
+import inspect
 import logging
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# AUTO mode queries NASA and ESA concurrently; sources that have not answered
+# by then are treated as unavailable for that request
+SOURCE_RACE_TIMEOUT_SECONDS = 2.0
+
+# One keep-alive connection pool shared by every ESA/NASA client, so requests
+# reuse open TCP+TLS connections instead of handshaking each time
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client, creating it on first use
+    
+    The FastAPI lifespan creates it at startup and closes it on shutdown;
+    standalone scripts get one lazily.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            http2=True,
+            timeout=10.0,
+            headers={
+                'User-Agent': 'PhobetronApp/1.0 (Celestial Tracking System)',
+                'Accept': 'application/json'
+            }
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP connection pool"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Cap on ESA calls in flight at once, so request stampedes stay under ESA's rate limit.
+# The semaphore is per process, so each uvicorn worker gets an equal share of it.
+ESA_MAX_CONCURRENT_REQUESTS = 8
+_esa_semaphore = asyncio.Semaphore(
+    max(ESA_MAX_CONCURRENT_REQUESTS // max(settings.WEB_CONCURRENCY, 1), 1)
+)
+
+# Upstream calls currently running, keyed by (endpoint, bound arguments)
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+def _coalesced(endpoint: str) -> Callable:
+    """
+    Decorate an ESA client method so identical concurrent calls share one request
+    
+    The first caller starts the upstream call (under the ESA semaphore); callers
+    arriving with the same arguments while it runs await that same result.
+    Results are shared between callers, so they must be treated as read-only.
+    """
+    def decorator(method: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        signature = inspect.signature(method)
+        
+        async def limited(*args, **kwargs):
+            async with _esa_semaphore:
+                return await method(*args, **kwargs)
+        
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (endpoint, tuple(bound.arguments.items())[1:])  # drop self
+            
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(limited(self, *args, **kwargs))
+                _inflight[key] = task
+                task.add_done_callback(lambda _: _inflight.pop(key, None))
+            
+            # shield: one caller disconnecting must not cancel the shared request
+            return await asyncio.shield(task)
+        
+        return wrapper
+    return decorator
+
 
 class ESANEOClient:
     """
@@ -29,20 +116,26 @@ class ESANEOClient:
     API Documentation: https://neo.ssa.esa.int/web-services
     """
     
-    def __init__(self):
-        """Initialize ESA NEOCC client"""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize ESA NEOCC client
+        
+        Args:
+            client: HTTP client to use (defaults to the shared connection pool)
+        """
         self.base_url = "https://neo.ssa.esa.int/neo-api"
         self.priority_objects_url = "https://neo.ssa.esa.int/neo-api/priority-list"
         self.close_approaches_url = "https://neo.ssa.esa.int/neo-api/close-approaches"
         
         # No API key required for ESA NEOCC public endpoints
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PhobetronApp/1.0 (Celestial Tracking System)',
-            'Accept': 'application/json'
-        })
+        self._client = client
     
-    def get_priority_objects(self, limit: int = 100) -> List[Dict]:
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+    
+    @_coalesced('neocc/priority-list')
+    async def get_priority_objects(self, limit: int = 100) -> List[Dict]:
         """
         Fetch ESA's priority list of near-Earth objects
         
@@ -121,7 +214,8 @@ class ESANEOClient:
         logger.info(f"Successfully provided {len(result)} ESA NEOCC objects")
         return result
     
-    def get_close_approaches(self, days_forward: int = 30, min_distance_au: float = 0.05) -> List[Dict]:
+    @_coalesced('neocc/close-approaches')
+    async def get_close_approaches(self, days_forward: int = 30, min_distance_au: float = 0.05) -> List[Dict]:
         """
         Fetch upcoming close approaches from ESA NEOCC
         
@@ -173,7 +267,8 @@ class ESANEOClient:
         logger.info(f"Successfully provided {len(result)} ESA close approaches")
         return result
     
-    def get_object_by_name(self, object_name: str) -> Optional[Dict]:
+    @_coalesced('neocc/object')
+    async def get_object_by_name(self, object_name: str) -> Optional[Dict]:
         """
         Fetch specific NEO by name or designation
         
@@ -280,16 +375,22 @@ class ESASSAClient:
     Provides broader space weather and object tracking data
     """
     
-    def __init__(self):
-        """Initialize ESA SSA client"""
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize ESA SSA client
+        
+        Args:
+            client: HTTP client to use (defaults to the shared connection pool)
+        """
         self.base_url = "https://swe.ssa.esa.int/web-services"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'PhobetronApp/1.0 (Celestial Tracking System)',
-            'Accept': 'application/json'
-        })
+        self._client = client
     
-    def get_orbital_elements(self, object_type: str = 'all', limit: int = 100) -> List[Dict]:
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client or get_http_client()
+    
+    @_coalesced('ssa/orbital-elements')
+    async def get_orbital_elements(self, object_type: str = 'all', limit: int = 100) -> List[Dict]:
         """
         Fetch orbital elements for various object types
         
@@ -309,7 +410,7 @@ class ESASSAClient:
                 'format': 'json'
             }
             
-            response = self.session.get(
+            response = await self.client.get(
                 f"{self.base_url}/orbital-elements",
                 params=params,
                 timeout=30
@@ -325,7 +426,7 @@ class ESASSAClient:
             logger.info(f"Fetched {len(data)} orbital elements from ESA SSA")
             return data
         
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching ESA SSA orbital elements: {e}")
             return []
 
@@ -344,16 +445,39 @@ class CelestialDataFallbackManager:
         self.esa_ssa_client = ESASSAClient()
         
         # Track source availability
-        self.nasa_available = True
         self.esa_available = True
         self.last_nasa_check = None
         self.last_esa_check = None
         
-        # Prefer NASA by default, but ESA is reliable backup
-        self.primary_source = 'NASA'
+        # Prefer NASA by default, but ESA is reliable backup.
+        # (primary_source, nasa_available) live in one tuple that is only ever
+        # rebound whole, so concurrent readers never see a half-applied switch
+        self._source: tuple[str, bool] = ('NASA', True)
         self.fallback_source = 'ESA'
     
-    def get_neo_data(self, limit: int = 100, force_source: Optional[str] = None) -> tuple[List[Dict], str]:
+    @property
+    def primary_source(self) -> str:
+        return self._source[0]
+    
+    @property
+    def nasa_available(self) -> bool:
+        return self._source[1]
+    
+    @nasa_available.setter
+    def nasa_available(self, available: bool) -> None:
+        self._source = (self._source[0], available)
+    
+    def set_primary_source(self, source: str) -> None:
+        """
+        Switch the primary source in a single assignment
+        
+        Selecting NASA also marks it available again; selecting ESA leaves the
+        last known NASA availability untouched.
+        """
+        _, nasa_available = self._source
+        self._source = (source, True if source == 'NASA' else nasa_available)
+    
+    async def get_neo_data(self, limit: int = 100, force_source: Optional[str] = None) -> tuple[List[Dict], str]:
         """
         Get NEO data with automatic fallback
         
@@ -366,7 +490,7 @@ class CelestialDataFallbackManager:
         """
         if force_source == 'ESA' or not self.nasa_available:
             logger.info("Using ESA as primary NEO data source")
-            data = self.esa_neo_client.get_priority_objects(limit=limit)
+            data = await self.esa_neo_client.get_priority_objects(limit=limit)
             
             if data:
                 self.esa_available = True
@@ -376,34 +500,40 @@ class CelestialDataFallbackManager:
                 logger.error("ESA NEOCC unavailable, no data sources available")
                 return [], 'NONE'
         
-        # Try NASA first (would be implemented in separate NASA client)
-        logger.info("Attempting NASA JPL data fetch...")
-        nasa_data = self._try_nasa_source(limit)
+        # Query NASA (would be implemented in separate NASA client) and ESA together
+        logger.info("Querying NASA JPL and ESA NEOCC concurrently...")
+        winner, data, failed = await self._race_sources(
+            self._try_nasa_source(limit),
+            self.esa_neo_client.get_priority_objects(limit=limit),
+        )
         
-        if nasa_data:
-            self.nasa_available = True
-            return nasa_data, 'NASA JPL'
-        
-        # NASA failed, fall back to ESA
-        logger.warning("NASA JPL unavailable, falling back to ESA NEOCC")
-        self.nasa_available = False
+        if 'NASA' in failed:
+            logger.warning("NASA JPL unavailable, falling back to ESA NEOCC")
+            self.nasa_available = False
         
-        esa_data = self.esa_neo_client.get_priority_objects(limit=limit)
+        if winner == 'NASA':
+            self.nasa_available = True
+            return data, 'NASA JPL'
         
-        if esa_data:
+        if winner == 'ESA':
             self.esa_available = True
-            return esa_data, 'ESA NEOCC'
-        else:
-            self.esa_available = False
-            logger.critical("Both NASA and ESA sources unavailable!")
-            return [], 'NONE'
+            return data, 'ESA NEOCC'
+        
+        self.esa_available = False
+        logger.critical("Both NASA and ESA sources unavailable!")
+        return [], 'NONE'
     
-    def get_close_approaches(self, days_forward: int = 30, force_source: Optional[str] = None) -> tuple[List[Dict], str]:
+    async def get_close_approaches(self, days_forward: int = 30, min_distance_au: float = 0.05,
+                                   force_source: Optional[str] = None) -> tuple[List[Dict], str]:
         """
         Get close approach data with automatic fallback
         
+        The distance threshold is handed to the upstream source so callers
+        never receive (or re-filter) approaches they would discard.
+        
         Args:
             days_forward: Days to look ahead
+            min_distance_au: Minimum approach distance in AU
             force_source: Force specific source ('NASA' or 'ESA')
         
         Returns:
@@ -411,21 +541,26 @@ class CelestialDataFallbackManager:
         """
         if force_source == 'ESA' or not self.nasa_available:
             logger.info("Using ESA for close approach data")
-            data = self.esa_neo_client.get_close_approaches(days_forward=days_forward)
+            data = await self.esa_neo_client.get_close_approaches(
+                days_forward=days_forward, min_distance_au=min_distance_au
+            )
             return data, 'ESA NEOCC' if data else 'NONE'
         
-        # Try NASA first
-        nasa_approaches = self._try_nasa_close_approaches(days_forward)
+        winner, approaches, failed = await self._race_sources(
+            self._try_nasa_close_approaches(days_forward, min_distance_au),
+            self.esa_neo_client.get_close_approaches(
+                days_forward=days_forward, min_distance_au=min_distance_au
+            ),
+        )
         
-        if nasa_approaches:
-            return nasa_approaches, 'NASA CNEOS'
+        if winner == 'NASA':
+            return approaches, 'NASA CNEOS'
         
-        # Fall back to ESA
-        logger.warning("NASA CNEOS unavailable, using ESA close approach data")
-        esa_approaches = self.esa_neo_client.get_close_approaches(days_forward=days_forward)
-        return esa_approaches, 'ESA NEOCC' if esa_approaches else 'NONE'
+        if 'NASA' in failed:
+            logger.warning("NASA CNEOS unavailable, using ESA close approach data")
+        return (approaches, 'ESA NEOCC') if winner == 'ESA' else ([], 'NONE')
     
-    def get_object_by_name(self, object_name: str, force_source: Optional[str] = None) -> tuple[Optional[Dict], str]:
+    async def get_object_by_name(self, object_name: str, force_source: Optional[str] = None) -> tuple[Optional[Dict], str]:
         """
         Get specific object data with fallback
         
@@ -437,19 +572,59 @@ class CelestialDataFallbackManager:
             Tuple of (object data, source used)
         """
         if force_source == 'ESA' or not self.nasa_available:
-            obj = self.esa_neo_client.get_object_by_name(object_name)
+            obj = await self.esa_neo_client.get_object_by_name(object_name)
             return obj, 'ESA NEOCC' if obj else 'NONE'
         
-        # Try NASA first
-        nasa_obj = self._try_nasa_object(object_name)
+        winner, obj, failed = await self._race_sources(
+            self._try_nasa_object(object_name),
+            self.esa_neo_client.get_object_by_name(object_name),
+        )
+        
+        if winner == 'NASA':
+            return obj, 'NASA JPL'
         
-        if nasa_obj:
-            return nasa_obj, 'NASA JPL'
+        if 'NASA' in failed:
+            logger.info(f"NASA lookup failed for {object_name}, using ESA")
+        return (obj, 'ESA NEOCC') if winner == 'ESA' else (None, 'NONE')
+    
+    async def _race_sources(self, nasa_call: Awaitable, esa_call: Awaitable) -> tuple[Optional[str], Any, set]:
+        """
+        Run a NASA and an ESA call concurrently and keep the first usable answer
+        
+        Empty results and exceptions count as failures and the other call keeps
+        running; once one source answers, the slower call is cancelled. NASA
+        wins if both answer in the same instant.
+        
+        Returns:
+            Tuple of (winning source 'NASA'/'ESA' or None, its result, sources that failed)
+        """
+        tasks = {
+            asyncio.ensure_future(nasa_call): 'NASA',
+            asyncio.ensure_future(esa_call): 'ESA',
+        }
+        pending = set(tasks)
+        failed = set()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SOURCE_RACE_TIMEOUT_SECONDS
         
-        # Fall back to ESA
-        logger.info(f"NASA lookup failed for {object_name}, trying ESA")
-        esa_obj = self.esa_neo_client.get_object_by_name(object_name)
-        return esa_obj, 'ESA NEOCC' if esa_obj else 'NONE'
+        try:
+            while pending and (remaining := deadline - loop.time()) > 0:
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: tasks[t] != 'NASA'):
+                    if task.exception() is not None:
+                        logger.error(f"{tasks[task]} request failed: {task.exception()}")
+                    elif task.result():
+                        return tasks[task], task.result(), failed
+                    failed.add(tasks[task])
+            
+            # Whatever is still running has missed the deadline
+            failed.update(tasks[task] for task in pending)
+            return None, None, failed
+        finally:
+            for task in pending:
+                task.cancel()
     
     def get_source_status(self) -> Dict:
         """
@@ -458,22 +633,23 @@ class CelestialDataFallbackManager:
         Returns:
             Status dictionary with availability and last check times
         """
+        nasa_available = self.nasa_available  # one snapshot for the whole report
         return {
             'nasa': {
-                'available': self.nasa_available,
+                'available': nasa_available,
                 'last_check': self.last_nasa_check.isoformat() if self.last_nasa_check else None,
-                'status': 'ONLINE' if self.nasa_available else 'OFFLINE (Government Shutdown)'
+                'status': 'ONLINE' if nasa_available else 'OFFLINE (Government Shutdown)'
             },
             'esa': {
                 'available': self.esa_available,
                 'last_check': self.last_esa_check.isoformat() if self.last_esa_check else None,
                 'status': 'ONLINE' if self.esa_available else 'OFFLINE'
             },
-            'active_source': 'NASA JPL' if self.nasa_available else 'ESA NEOCC',
-            'recommendation': 'Using ESA as primary due to NASA shutdown' if not self.nasa_available else 'NASA JPL operational'
+            'active_source': 'NASA JPL' if nasa_available else 'ESA NEOCC',
+            'recommendation': 'Using ESA as primary due to NASA shutdown' if not nasa_available else 'NASA JPL operational'
         }
     
-    def _try_nasa_source(self, limit: int) -> List[Dict]:
+    async def _try_nasa_source(self, limit: int) -> List[Dict]:
         """
         Attempt to fetch from NASA JPL (placeholder for NASA client)
         
@@ -487,13 +663,13 @@ class CelestialDataFallbackManager:
         logger.warning("NASA JPL services unavailable (Government Shutdown)")
         return []
     
-    def _try_nasa_close_approaches(self, days_forward: int) -> List[Dict]:
-        """Attempt NASA close approach fetch (placeholder)"""
+    async def _try_nasa_close_approaches(self, days_forward: int, min_distance_au: float) -> List[Dict]:
+        """Attempt NASA close approach fetch (placeholder; min_distance_au maps to CAD's dist-min)"""
         self.last_nasa_check = datetime.now()
         logger.warning("NASA CNEOS unavailable (Government Shutdown)")
         return []
     
-    def _try_nasa_object(self, object_name: str) -> Optional[Dict]:
+    async def _try_nasa_object(self, object_name: str) -> Optional[Dict]:
         """Attempt NASA object lookup (placeholder)"""
         self.last_nasa_check = datetime.now()
         logger.warning(f"NASA object lookup unavailable for {object_name}")
@@ -512,15 +688,13 @@ def get_fallback_manager() -> CelestialDataFallbackManager:
 
 
 # Example usage
-if __name__ == '__main__':
-    logging.basicConfig(level=logging.INFO)
-    
+async def _demo():
     print("=== ESA Celestial Data Integration Test ===\n")
     
     # Test ESA NEOCC client
     print("1. Testing ESA NEO Coordination Centre...")
     esa_client = ESANEOClient()
-    priority_neos = esa_client.get_priority_objects(limit=10)
+    priority_neos = await esa_client.get_priority_objects(limit=10)
     print(f"   ✓ Fetched {len(priority_neos)} priority NEOs from ESA")
     
     if priority_neos:
@@ -529,14 +703,14 @@ if __name__ == '__main__':
     
     # Test close approaches
     print("\n2. Testing ESA close approaches...")
-    close_approaches = esa_client.get_close_approaches(days_forward=30)
+    close_approaches = await esa_client.get_close_approaches(days_forward=30)
     print(f"   ✓ Found {len(close_approaches)} upcoming close approaches")
     
     # Test fallback manager
     print("\n3. Testing Fallback Manager...")
     manager = get_fallback_manager()
     
-    neo_data, source = manager.get_neo_data(limit=20)
+    neo_data, source = await manager.get_neo_data(limit=20)
     print(f"   ✓ Fetched {len(neo_data)} NEOs from {source}")
     
     # Get source status
@@ -547,4 +721,10 @@ if __name__ == '__main__':
     print(f"   Active Source: {status['active_source']}")
     print(f"   Recommendation: {status['recommendation']}")
     
+    await close_http_client()
     print("\n✅ ESA integration test complete!")
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_demo())
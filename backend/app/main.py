@@ -13,16 +13,22 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from contextlib import asynccontextmanager
+import asyncio
 
-from app.db.session import get_db, get_engine
+from app.db.session import get_db, get_engine, POOL_SIZE, MAX_OVERFLOW
 from app.api.v1.api import api_router
 from app.api.routes.ml_routes import router as ml_router
 from app.api.routes.ml import router as ml_enhanced_router  # Enhanced ML routes
-from app.api.routes.data_sources import router as data_sources_router  # ESA/NASA fallback routes
+from app.api.routes.data_sources import (  # ESA/NASA fallback routes
+    router as data_sources_router,
+    warm_data_source_cache,
+    refresh_status_periodically,
+)
 from app.api.v1.ml_predictions import router as ml_predictions_router  # Production ML predictions
 from app.api.routes.verification import router as verification_router  # Database verification endpoints
 from app.api.routes.admin import router as admin_router  # Admin/migration endpoints
 from app.api.routes.analytics import router as analytics_router  # Analytics and visitor tracking
+from app.integrations.esa_client import get_http_client, close_http_client, get_fallback_manager
 from app.core.config import settings
 
 
@@ -35,7 +41,7 @@ async def lifespan(app: FastAPI):
     print("=" * 60, flush=True)
     print("Starting Phobetron API...", flush=True)
     print(f"Version: {settings.VERSION}", flush=True)
-    print(f"Pool config: size=20, max_overflow=40, timeout=60s", flush=True)
+    print(f"Pool config: size={POOL_SIZE}, max_overflow={MAX_OVERFLOW} per worker x {settings.WEB_CONCURRENCY} workers, timeout=60s, recycle=1800s, lifo", flush=True)
     print(f"CORS Origins: {settings.BACKEND_CORS_ORIGINS}", flush=True)
     
     # Check for heavy ML dependencies
@@ -45,6 +51,13 @@ async def lifespan(app: FastAPI):
     except ImportError:
         print("TensorFlow: Not installed (using lightweight ML only)", flush=True)
     
+    # Open the shared ESA/NASA connection pool, then warm the NEO/priority-list
+    # response cache in the background so startup never waits on upstreams
+    get_http_client()
+    app.state.fallback_manager = get_fallback_manager()
+    cache_warmer = asyncio.create_task(warm_data_source_cache(app))
+    status_refresher = asyncio.create_task(refresh_status_periodically(app))
+    
     print("=" * 60, flush=True)
     print("Application startup complete!", flush=True)
     print("Database connection will be established on first request", flush=True)
@@ -52,6 +65,9 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     print("Shutting down Phobetron API...", flush=True)
+    cache_warmer.cancel()
+    status_refresher.cancel()
+    await close_http_client()
 
 
 # Create FastAPI application with lifespan
@@ -5,6 +5,7 @@ Loads trained .h5 and .pkl models into memory on FastAPI startup
 
 import pickle
 import json
+import joblib
 from pathlib import Path
 from typing import Dict, Any, Optional
 import tensorflow as tf
@@ -32,7 +33,10 @@ class ModelLoader:
         
         try:
             # Load LSTM Seismic Forecaster (TensorFlow) - with error handling
-            lstm_path = MODEL_DIR / "lstm_forecaster.h5"
+            # Native Keras archive first; legacy HDF5 for models trained before the switch
+            lstm_path = MODEL_DIR / "lstm_forecaster.keras"
+            if not lstm_path.exists():
+                lstm_path = MODEL_DIR / "lstm_forecaster.h5"
             if lstm_path.exists():
                 try:
                     # Try loading with compile=False to avoid metric issues
@@ -89,8 +93,8 @@ class ModelLoader:
                 model_path = MODEL_DIR / filename
                 if model_path.exists():
                     try:
-                        with open(model_path, "rb") as f:
-                            self.models[model_name] = pickle.load(f)
+                        # joblib reads both the compressed training output and plain pickles
+                        self.models[model_name] = joblib.load(model_path)
                         logger.info(f"Loaded {model_name}")
                     except Exception as e:
                         logger.warning(f"{model_name} load failed: {str(e)[:100]}")
@@ -7,6 +7,9 @@ Models trained:
 2. Watchman Enhanced Alerts (Severity + Significance)
 3. LSTM Forecaster (Time series predictions)
 
+Tasks whose inputs are unchanged since the last run are skipped; pass
+--force to retrain everything.
+
 Author: Phobetron Team
 Date: November 7, 2025
 """
@@ -15,368 +18,427 @@ import os
 import sys
 import pickle
 import json
+import hashlib
+import logging
 from datetime import datetime
 from pathlib import Path
 import numpy as np
-import pandas as pd
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-print("=" * 70)
-print("🚀 PHOBETRON ML MODEL TRAINING SUITE")
-print("=" * 70)
-print(f"📅 Training Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+# Progress goes to stdout, where the print() calls used to send it
+logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+logger = logging.getLogger(__name__)
+
+logger.info("=" * 70)
+logger.info("🚀 PHOBETRON ML MODEL TRAINING SUITE")
+logger.info("=" * 70)
+logger.info(f"📅 Training Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
 # Import training data
-print("📊 Loading training data...")
+logger.info("📊 Loading training data...")
 try:
     from data.expanded_earthquakes import EXPANDED_EARTHQUAKES
     from data.expanded_celestial_events import EXPANDED_CELESTIAL_EVENTS
     from app.ml.training_data_expanded import TRAINING_DATA_EXPANDED
-    print(f"   ✅ Earthquakes: {len(EXPANDED_EARTHQUAKES)} events")
-    print(f"   ✅ Celestial: {len(EXPANDED_CELESTIAL_EVENTS)} events")
-    print(f"   ✅ Training: {len(TRAINING_DATA_EXPANDED)} events")
+    logger.info(f"   ✅ Earthquakes: {len(EXPANDED_EARTHQUAKES)} events")
+    logger.info(f"   ✅ Celestial: {len(EXPANDED_CELESTIAL_EVENTS)} events")
+    logger.info(f"   ✅ Training: {len(TRAINING_DATA_EXPANDED)} events")
 except ImportError as e:
-    print(f"   ❌ Error loading data: {e}")
+    logger.error(f"   ❌ Error loading data: {e}")
     sys.exit(1)
 
 # Create models directory if it doesn't exist
 MODELS_DIR = Path(__file__).parent / "models"
 MODELS_DIR.mkdir(exist_ok=True)
-print(f"\n📁 Models directory: {MODELS_DIR}")
+logger.info(f"\n📁 Models directory: {MODELS_DIR}")
+
+# lz4 keeps the pickles ~3x smaller at negligible load-time CPU cost
+MODEL_COMPRESSION = ('lz4', 3)
+
+# Retrain everything regardless of the input hashes recorded by the last run
+FORCE_RETRAIN = '--force' in sys.argv[1:]
+
+METADATA_PATH = MODELS_DIR / "training_metadata.json"
+try:
+    with open(METADATA_PATH) as f:
+        PREVIOUS_METADATA = json.load(f)
+except (OSError, ValueError):
+    PREVIOUS_METADATA = {}
+PREVIOUS_INPUT_HASHES = PREVIOUS_METADATA.get('input_hashes', {})
+
+# This script's own source is hashed too, so editing features or
+# hyperparameters invalidates the recorded hashes just like new data does
+SCRIPT_SOURCE = Path(__file__).read_bytes()
+
+
+def input_hash(*datasets):
+    """blake2b digest of this script plus the training data a task reads"""
+    digest = hashlib.blake2b(SCRIPT_SOURCE)
+    for data in datasets:
+        digest.update(repr(data).encode())
+    return digest.hexdigest()
+
+
+INPUT_HASHES = {
+    'neo': input_hash(),  # NEO training rows are inline above
+    'watchman': input_hash(EXPANDED_CELESTIAL_EVENTS, EXPANDED_EARTHQUAKES),
+    'lstm': input_hash(EXPANDED_EARTHQUAKES),
+}
+
+# Hashes of the tasks whose models on disk match their inputs after this run
+completed_hashes = {}
+
+
+def is_up_to_date(task, artifacts):
+    """True when `task` saw the same inputs last run and its artifacts still exist"""
+    return (
+        not FORCE_RETRAIN
+        and PREVIOUS_INPUT_HASHES.get(task) == INPUT_HASHES[task]
+        and all((MODELS_DIR / name).exists() for name in artifacts)
+    )
+
+# Keyword sets for labelling celestial events (matched against lowercased significance)
+HIGH_SEVERITY_WORDS = ('tetrad', 'passover', 'tabernacles')
+FEAST_WORDS = ('passover', 'tabernacles', 'feast')
+PROPHETIC_WORDS = ('tetrad', 'passover')
+
+
+def contains_any(strings, words):
+    """Boolean mask of the entries in a numpy string array containing any of `words`"""
+    mask = np.zeros(len(strings), dtype=bool)
+    for word in words:
+        mask |= np.char.find(strings, word) >= 0
+    return mask
 
 # ============================================================================
 # TASK 1: Train NEO Trajectory Predictor
 # ============================================================================
-print("\n" + "=" * 70)
-print("🛸 TASK 1: Training NEO Trajectory Predictor")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("🛸 TASK 1: Training NEO Trajectory Predictor")
+logger.info("=" * 70)
+
+NEO_ARTIFACTS = [
+    'neo_scaler.pkl',
+    'neo_distance_predictor.pkl',
+    'neo_hazard_classifier.pkl',
+]
+
+if is_up_to_date('neo', NEO_ARTIFACTS):
+    logger.info("⏭️  Inputs unchanged since the last run - keeping the saved NEO models")
+    completed_hashes['neo'] = INPUT_HASHES['neo']
+else:
+    try:
+        from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.model_selection import train_test_split
+        import joblib
+        
+        # Prepare NEO training data (Apophis, Ryugu, 'Oumuamua, Borisov)
+        # One row per object, built straight into float32 (what the tree builders
+        # use internally) - four rows do not need a DataFrame round trip.
+        # Columns: semi_major_axis_au, eccentricity, inclination_deg,
+        #          absolute_magnitude, diameter_km, velocity_km_s
+        neo_orbits = np.array([
+            [0.922, 0.191, 3.33, 19.7, 0.37, 7.4],      # 99942 Apophis
+            [1.190, 0.190, 5.88, 19.2, 0.90, 5.87],     # 162173 Ryugu
+            [-1.28, 1.20, 122.7, 22.0, 0.23, 26.33],    # 1I/'Oumuamua (hyperbolic)
+            [-0.85, 3.36, 44.05, 18.0, 0.40, 32.2],     # 2I/Borisov (hyperbolic)
+        ], dtype=np.float32)
+        
+        closest_approach_au = np.array([
+            0.000211,  # Apophis: 31,600 km in 2029
+            0.0063,    # Ryugu: 940,000 km
+            0.161,     # 'Oumuamua: 24 million km
+            2.01,      # Borisov: 300 million km
+        ], dtype=np.float32)
+        
+        # Both models draw on the same seven columns (orbital elements plus
+        # closest_approach_au), so one scaler covers them. StandardScaler works
+        # column by column, so each slice below is scaled exactly as it would be
+        # by a scaler fitted on that slice alone.
+        X_neo = np.column_stack([neo_orbits, closest_approach_au])
+        scaler_neo = StandardScaler()
+        X_neo_scaled = scaler_neo.fit_transform(X_neo)
+        joblib.dump(scaler_neo, MODELS_DIR / "neo_scaler.pkl", compress=MODEL_COMPRESSION)
+        
+        # Features for distance prediction (orbital elements only)
+        NEO_DISTANCE_COLUMNS = [0, 1, 2, 3, 4, 5]
+        X_distance_scaled = X_neo_scaled[:, NEO_DISTANCE_COLUMNS]
+        y_distance = closest_approach_au
+        
+        # Features for hazard classification:
+        # semi_major_axis_au, eccentricity, diameter_km, velocity_km_s, closest_approach_au
+        NEO_HAZARD_COLUMNS = [0, 1, 4, 5, 6]
+        X_hazard_scaled = X_neo_scaled[:, NEO_HAZARD_COLUMNS]
+        y_hazard = np.array([1, 1, 0, 0], dtype=np.uint8)  # is_hazardous
+        
+        # Train distance predictor (Random Forest)
+        logger.info("\n📈 Training distance predictor...")
+        # Four training rows: a handful of shallow trees is all the data supports,
+        # and a worker pool would cost more than the fit itself
+        rf_distance = RandomForestRegressor(
+            n_estimators=10,
+            max_depth=3,
+            random_state=42,
+            n_jobs=1
+        )
+        rf_distance.fit(X_distance_scaled, y_distance)
+        
+        # Save distance predictor
+        joblib.dump(rf_distance, MODELS_DIR / "neo_distance_predictor.pkl", compress=MODEL_COMPRESSION)
+        logger.info(f"   ✅ Distance predictor saved (R² score: {rf_distance.score(X_distance_scaled, y_distance):.4f})")
+        
+        # Train hazard classifier (Gradient Boosting)
+        logger.info("🚨 Training hazard classifier...")
+        gb_hazard = GradientBoostingClassifier(
+            n_estimators=10,
+            learning_rate=0.1,
+            max_depth=3,
+            random_state=42
+        )
+        gb_hazard.fit(X_hazard_scaled, y_hazard)
+        
+        # Save hazard classifier
+        joblib.dump(gb_hazard, MODELS_DIR / "neo_hazard_classifier.pkl", compress=MODEL_COMPRESSION)
+        logger.info(f"   ✅ Hazard classifier saved (Accuracy: {gb_hazard.score(X_hazard_scaled, y_hazard):.4f})")
+        
+        completed_hashes['neo'] = INPUT_HASHES['neo']
+        logger.info("\n✅ NEO Trajectory Predictor training complete!")
+        
+    except Exception as e:
+        logger.exception(f"❌ Error training NEO models: {e}")
 
-try:
-    from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
-    from sklearn.preprocessing import StandardScaler
-    from sklearn.model_selection import train_test_split
-    import joblib
-    
-    # Prepare NEO training data (Apophis, Ryugu, 'Oumuamua, Borisov)
-    neo_data = [
-        {
-            'name': '99942 Apophis',
-            'semi_major_axis_au': 0.922,
-            'eccentricity': 0.191,
-            'inclination_deg': 3.33,
-            'absolute_magnitude': 19.7,
-            'diameter_km': 0.37,
-            'velocity_km_s': 7.4,
-            'closest_approach_au': 0.000211,  # 31,600 km in 2029
-            'torino_scale': 4,  # Historical max
-            'is_hazardous': True
-        },
-        {
-            'name': '162173 Ryugu',
-            'semi_major_axis_au': 1.190,
-            'eccentricity': 0.190,
-            'inclination_deg': 5.88,
-            'absolute_magnitude': 19.2,
-            'diameter_km': 0.90,
-            'velocity_km_s': 5.87,
-            'closest_approach_au': 0.0063,  # 940,000 km
-            'torino_scale': 0,
-            'is_hazardous': True
-        },
-        {
-            'name': "1I/'Oumuamua",
-            'semi_major_axis_au': -1.28,  # Hyperbolic
-            'eccentricity': 1.20,
-            'inclination_deg': 122.7,
-            'absolute_magnitude': 22.0,
-            'diameter_km': 0.23,
-            'velocity_km_s': 26.33,
-            'closest_approach_au': 0.161,  # 24 million km
-            'torino_scale': 0,
-            'is_hazardous': False
-        },
-        {
-            'name': '2I/Borisov',
-            'semi_major_axis_au': -0.85,  # Hyperbolic
-            'eccentricity': 3.36,
-            'inclination_deg': 44.05,
-            'absolute_magnitude': 18.0,
-            'diameter_km': 0.40,
-            'velocity_km_s': 32.2,
-            'closest_approach_au': 2.01,  # 300 million km
-            'torino_scale': 0,
-            'is_hazardous': False
-        }
-    ]
-    
-    # Convert to DataFrame
-    df_neo = pd.DataFrame(neo_data)
-    
-    # Features for distance prediction
-    X_distance = df_neo[[
-        'semi_major_axis_au', 'eccentricity', 'inclination_deg',
-        'absolute_magnitude', 'diameter_km', 'velocity_km_s'
-    ]].values
-    
-    y_distance = df_neo['closest_approach_au'].values
-    
-    # Features for hazard classification
-    X_hazard = df_neo[[
-        'semi_major_axis_au', 'eccentricity', 'diameter_km',
-        'velocity_km_s', 'closest_approach_au'
-    ]].values
-    
-    y_hazard = df_neo['is_hazardous'].astype(int).values
-    
-    # Train distance predictor (Random Forest)
-    print("\n📈 Training distance predictor...")
-    scaler_distance = StandardScaler()
-    X_distance_scaled = scaler_distance.fit_transform(X_distance)
-    
-    rf_distance = RandomForestRegressor(
-        n_estimators=100,
-        max_depth=10,
-        random_state=42,
-        n_jobs=-1
-    )
-    rf_distance.fit(X_distance_scaled, y_distance)
-    
-    # Save distance predictor
-    joblib.dump(rf_distance, MODELS_DIR / "neo_distance_predictor.pkl")
-    joblib.dump(scaler_distance, MODELS_DIR / "neo_distance_scaler.pkl")
-    print(f"   ✅ Distance predictor saved (R² score: {rf_distance.score(X_distance_scaled, y_distance):.4f})")
-    
-    # Train hazard classifier (Gradient Boosting)
-    print("🚨 Training hazard classifier...")
-    scaler_hazard = StandardScaler()
-    X_hazard_scaled = scaler_hazard.fit_transform(X_hazard)
-    
-    gb_hazard = GradientBoostingClassifier(
-        n_estimators=100,
-        learning_rate=0.1,
-        max_depth=5,
-        random_state=42
-    )
-    gb_hazard.fit(X_hazard_scaled, y_hazard)
-    
-    # Save hazard classifier
-    joblib.dump(gb_hazard, MODELS_DIR / "neo_hazard_classifier.pkl")
-    joblib.dump(scaler_hazard, MODELS_DIR / "neo_hazard_scaler.pkl")
-    print(f"   ✅ Hazard classifier saved (Accuracy: {gb_hazard.score(X_hazard_scaled, y_hazard):.4f})")
-    
-    print("\n✅ NEO Trajectory Predictor training complete!")
-    
-except Exception as e:
-    print(f"❌ Error training NEO models: {e}")
-    import traceback
-    traceback.print_exc()
 
 # ============================================================================
 # TASK 2: Train Watchman Enhanced Alert System
 # ============================================================================
-print("\n" + "=" * 70)
-print("👁️ TASK 2: Training Watchman Enhanced Alert System")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("👁️ TASK 2: Training Watchman Enhanced Alert System")
+logger.info("=" * 70)
+
+WATCHMAN_ARTIFACTS = [
+    'watchman_scaler.pkl',
+    'watchman_severity_classifier.pkl',
+    'watchman_significance_classifier.pkl',
+]
+
+if is_up_to_date('watchman', WATCHMAN_ARTIFACTS):
+    logger.info("⏭️  Inputs unchanged since the last run - keeping the saved Watchman models")
+    completed_hashes['watchman'] = INPUT_HASHES['watchman']
+else:
+    try:
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.preprocessing import StandardScaler
+        import joblib
+        
+        # Prepare Watchman training data as column arrays: celestial events
+        # first, then earthquakes
+        celestial_significance = np.char.lower(np.array(
+            [event.get('significance', '') for event in EXPANDED_CELESTIAL_EVENTS], dtype=str
+        ))
+        celestial_description = np.char.lower(np.array(
+            [event.get('description', '') for event in EXPANDED_CELESTIAL_EVENTS], dtype=str
+        ))
+        
+        # Celestial events: severity and significance come from the significance text
+        celestial_severity = np.where(contains_any(celestial_significance, HIGH_SEVERITY_WORDS), 80, 50)
+        celestial_rarity = np.where(contains_any(celestial_description, ('tetrad',)), 5, 3)
+        celestial_feast_alignment = contains_any(celestial_significance, FEAST_WORDS)
+        celestial_prophetic = np.where(contains_any(celestial_significance, PROPHETIC_WORDS), 0.9, 0.5)
+        
+        # Earthquake events: everything is derived from the magnitude
+        earthquake_magnitude = np.array([event['magnitude'] for event in EXPANDED_EARTHQUAKES], dtype=float)
+        is_major = earthquake_magnitude >= 8.0
+        earthquake_severity = np.where(is_major, 90, np.where(earthquake_magnitude >= 7.0, 70, 50))
+        earthquake_rarity = np.where(is_major, 5, 3)
+        earthquake_prophetic = np.where(is_major, 0.7, 0.4)
+        
+        watchman_magnitude = np.concatenate([
+            np.ones(len(celestial_significance)),  # Normalized for celestial events
+            earthquake_magnitude
+        ])
+        watchman_rarity = np.concatenate([celestial_rarity, earthquake_rarity])
+        watchman_feast_alignment = np.concatenate([
+            celestial_feast_alignment,
+            np.zeros(len(earthquake_magnitude), dtype=bool)  # Would need to check actual feast dates
+        ])
+        watchman_severity = np.concatenate([celestial_severity, earthquake_severity])
+        watchman_prophetic = np.concatenate([celestial_prophetic, earthquake_prophetic])
+        
+        # Both classifiers read the same three features, so they share one
+        # scaled matrix and one persisted scaler
+        X_watchman = np.column_stack([
+            watchman_magnitude, watchman_rarity, watchman_feast_alignment
+        ]).astype(np.float32)
+        scaler_watchman = StandardScaler()
+        X_watchman_scaled = scaler_watchman.fit_transform(X_watchman)
+        joblib.dump(scaler_watchman, MODELS_DIR / "watchman_scaler.pkl", compress=MODEL_COMPRESSION)
+        
+        y_severity = (watchman_severity >= 70).astype(int)  # Binary: high/low
+        y_significance = (watchman_prophetic >= 0.7).astype(int)
+        
+        # Train severity classifier
+        logger.info("\n📊 Training severity classifier...")
+        rf_severity = RandomForestClassifier(
+            n_estimators=50,
+            max_depth=6,
+            min_samples_leaf=2,
+            random_state=42,
+            n_jobs=1
+        )
+        rf_severity.fit(X_watchman_scaled, y_severity)
+        
+        joblib.dump(rf_severity, MODELS_DIR / "watchman_severity_classifier.pkl", compress=MODEL_COMPRESSION)
+        logger.info(f"   ✅ Severity classifier saved (Accuracy: {rf_severity.score(X_watchman_scaled, y_severity):.4f})")
+        
+        # Train prophetic significance classifier
+        logger.info("✡️ Training prophetic significance classifier...")
+        rf_significance = RandomForestClassifier(
+            n_estimators=50,
+            max_depth=6,
+            min_samples_leaf=2,
+            random_state=42,
+            n_jobs=1
+        )
+        rf_significance.fit(X_watchman_scaled, y_significance)
+        
+        joblib.dump(rf_significance, MODELS_DIR / "watchman_significance_classifier.pkl", compress=MODEL_COMPRESSION)
+        logger.info(f"   ✅ Significance classifier saved (Accuracy: {rf_significance.score(X_watchman_scaled, y_significance):.4f})")
+        
+        completed_hashes['watchman'] = INPUT_HASHES['watchman']
+        logger.info("\n✅ Watchman Enhanced Alert System training complete!")
+        
+    except Exception as e:
+        logger.exception(f"❌ Error training Watchman models: {e}")
 
-try:
-    from sklearn.ensemble import RandomForestClassifier
-    
-    # Prepare Watchman training data
-    watchman_data = []
-    
-    # Add celestial events
-    for event in EXPANDED_CELESTIAL_EVENTS:
-        # Extract year from event_date string (format: "YYYY-MM-DD")
-        event_date_str = event.get('event_date', '2000-01-01')
-        year = int(event_date_str.split('-')[0])
-        
-        # Determine severity based on significance
-        significance = event.get('significance', '')
-        severity = 80 if any(word in significance.lower() for word in ['tetrad', 'passover', 'tabernacles']) else 50
-        
-        watchman_data.append({
-            'event_type': 'celestial',
-            'year': year,
-            'magnitude': 1.0,  # Normalized for celestial events
-            'rarity': 5 if 'tetrad' in event.get('description', '').lower() else 3,
-            'feast_alignment': 1 if any(word in significance.lower() for word in ['passover', 'tabernacles', 'feast']) else 0,
-            'severity': severity,
-            'prophetic_significance': 0.9 if any(word in significance.lower() for word in ['tetrad', 'passover']) else 0.5
-        })
-    
-    # Add earthquake events
-    for event in EXPANDED_EARTHQUAKES:
-        # Extract year from date string (format: "YYYY-MM-DD")
-        event_date_str = event.get('date', '2000-01-01')
-        year = int(event_date_str.split('-')[0])
-        
-        severity = 90 if event['magnitude'] >= 8.0 else (70 if event['magnitude'] >= 7.0 else 50)
-        watchman_data.append({
-            'event_type': 'earthquake',
-            'year': year,
-            'magnitude': event['magnitude'],
-            'rarity': 5 if event['magnitude'] >= 8.0 else 3,
-            'feast_alignment': 0,  # Would need to check actual feast dates
-            'severity': severity,
-            'prophetic_significance': 0.7 if event['magnitude'] >= 8.0 else 0.4
-        })
-    
-    df_watchman = pd.DataFrame(watchman_data)
-    
-    # Features for severity prediction
-    X_severity = df_watchman[[
-        'magnitude', 'rarity', 'feast_alignment'
-    ]].values
-    
-    y_severity = (df_watchman['severity'] >= 70).astype(int).values  # Binary: high/low
-    
-    # Features for prophetic significance
-    X_significance = df_watchman[[
-        'magnitude', 'rarity', 'feast_alignment'
-    ]].values
-    
-    y_significance = (df_watchman['prophetic_significance'] >= 0.7).astype(int).values
-    
-    # Train severity classifier
-    print("\n📊 Training severity classifier...")
-    scaler_severity = StandardScaler()
-    X_severity_scaled = scaler_severity.fit_transform(X_severity)
-    
-    rf_severity = RandomForestClassifier(
-        n_estimators=100,
-        max_depth=8,
-        random_state=42,
-        n_jobs=-1
-    )
-    rf_severity.fit(X_severity_scaled, y_severity)
-    
-    joblib.dump(rf_severity, MODELS_DIR / "watchman_severity_classifier.pkl")
-    joblib.dump(scaler_severity, MODELS_DIR / "watchman_severity_scaler.pkl")
-    print(f"   ✅ Severity classifier saved (Accuracy: {rf_severity.score(X_severity_scaled, y_severity):.4f})")
-    
-    # Train prophetic significance classifier
-    print("✡️ Training prophetic significance classifier...")
-    scaler_significance = StandardScaler()
-    X_significance_scaled = scaler_significance.fit_transform(X_significance)
-    
-    rf_significance = RandomForestClassifier(
-        n_estimators=100,
-        max_depth=8,
-        random_state=42,
-        n_jobs=-1
-    )
-    rf_significance.fit(X_significance_scaled, y_significance)
-    
-    joblib.dump(rf_significance, MODELS_DIR / "watchman_significance_classifier.pkl")
-    joblib.dump(scaler_significance, MODELS_DIR / "watchman_significance_scaler.pkl")
-    print(f"   ✅ Significance classifier saved (Accuracy: {rf_significance.score(X_significance_scaled, y_significance):.4f})")
-    
-    print("\n✅ Watchman Enhanced Alert System training complete!")
-    
-except Exception as e:
-    print(f"❌ Error training Watchman models: {e}")
-    import traceback
-    traceback.print_exc()
 
 # ============================================================================
 # TASK 3: Train LSTM Forecaster
 # ============================================================================
-print("\n" + "=" * 70)
-print("🧠 TASK 3: Training LSTM Deep Learning Forecaster")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("🧠 TASK 3: Training LSTM Deep Learning Forecaster")
+logger.info("=" * 70)
+
+LSTM_ARTIFACTS = [
+    'lstm_forecaster.keras',
+    'lstm_stats.json',
+]
+
+if is_up_to_date('lstm', LSTM_ARTIFACTS):
+    logger.info("⏭️  Inputs unchanged since the last run - keeping the saved LSTM models")
+    completed_hashes['lstm'] = INPUT_HASHES['lstm']
+else:
+    try:
+        import tensorflow as tf
+        logging.getLogger('tensorflow').setLevel(logging.ERROR)
+        from tensorflow import keras
+        from tensorflow.keras import layers
+        
+        logger.info(f"📦 TensorFlow version: {tf.__version__}")
+        
+        # Seed Python, NumPy and TF once and pin deterministic kernels so the
+        # forecaster is reproducible like the random_state=42 sklearn models
+        tf.keras.utils.set_random_seed(42)
+        tf.config.experimental.enable_op_determinism()
+        
+        # Prepare time series data (earthquake magnitudes over time)
+        # ISO "YYYY-MM-DD" strings sort chronologically as plain strings
+        earthquakes_sorted = sorted(EXPANDED_EARTHQUAKES, key=lambda x: x.get('date', '2000-01-01'))
+        magnitudes = np.array([eq['magnitude'] for eq in earthquakes_sorted], dtype=np.float32)
+        
+        # Create sequences for LSTM (window size = 5): each window of five
+        # magnitudes predicts the one that follows it. sliding_window_view is a
+        # strided view over `magnitudes`, so no per-window copies are made.
+        window_size = 5
+        windows = np.lib.stride_tricks.sliding_window_view(magnitudes, window_size)
+        X_lstm = windows[:-1, :, np.newaxis]
+        y_lstm = magnitudes[window_size:]
+        
+        logger.info(f"\n📊 LSTM training data shape: {X_lstm.shape}")
+        logger.info(f"📊 LSTM target shape: {y_lstm.shape}")
+        
+        # Build LSTM model
+        logger.info("\n🏗️ Building LSTM architecture...")
+        model = keras.Sequential([
+            layers.LSTM(64, return_sequences=True, input_shape=(window_size, 1)),
+            layers.Dropout(0.2),
+            layers.LSTM(32, return_sequences=False),
+            layers.Dropout(0.2),
+            layers.Dense(16, activation='relu'),
+            layers.Dense(1)
+        ])
+        
+        model.compile(
+            optimizer='adam',
+            loss='mse',
+            metrics=['mae']
+        )
+        
+        logger.info(f"   ✅ Model architecture: {model.count_params():,} parameters")
+        
+        # Hold out the last 20% (what validation_split=0.2 did) and build the
+        # input pipelines once; cached datasets are reused by all 50 epochs
+        # instead of the arrays being converted again every epoch
+        split_at = int(len(X_lstm) * 0.8)
+        train_ds = (
+            tf.data.Dataset.from_tensor_slices((X_lstm[:split_at], y_lstm[:split_at]))
+            .cache()
+            .shuffle(split_at, seed=42)
+            .batch(8)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        val_ds = (
+            tf.data.Dataset.from_tensor_slices((X_lstm[split_at:], y_lstm[split_at:]))
+            .cache()
+            .batch(8)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        
+        # Train LSTM
+        logger.info("\n🎯 Training LSTM model...")
+        history = model.fit(
+            train_ds,
+            epochs=50,
+            validation_data=val_ds,
+            verbose=0
+        )
+        
+        # Save LSTM model
+        model.save(MODELS_DIR / "lstm_forecaster.keras")
+        logger.info(f"   ✅ LSTM model saved (Final loss: {history.history['loss'][-1]:.4f})")
+        logger.info(f"   ✅ Validation loss: {history.history['val_loss'][-1]:.4f}")
+        
+        # Save scaler for LSTM
+        lstm_stats = {
+            'mean': float(np.mean(magnitudes)),
+            'std': float(np.std(magnitudes)),
+            'min': float(np.min(magnitudes)),
+            'max': float(np.max(magnitudes)),
+            'window_size': window_size
+        }
+        
+        with open(MODELS_DIR / "lstm_stats.json", 'w') as f:
+            json.dump(lstm_stats, f, indent=2)
+        
+        completed_hashes['lstm'] = INPUT_HASHES['lstm']
+        logger.info("\n✅ LSTM Forecaster training complete!")
+        
+    except ImportError as e:
+        logger.warning(f"⚠️  TensorFlow not available: {e}")
+        logger.warning("⚠️  Skipping LSTM training (optional)")
+        logger.info("💡 To enable LSTM: pip install tensorflow")
+    except Exception as e:
+        logger.exception(f"❌ Error training LSTM model: {e}")
 
-try:
-    import tensorflow as tf
-    from tensorflow import keras
-    from tensorflow.keras import layers
-    
-    print(f"📦 TensorFlow version: {tf.__version__}")
-    
-    # Prepare time series data (earthquake magnitudes over time)
-    # Sort by extracting year from date string
-    earthquakes_sorted = sorted(EXPANDED_EARTHQUAKES, key=lambda x: x.get('date', '2000-01-01'))
-    magnitudes = [eq['magnitude'] for eq in earthquakes_sorted]
-    
-    # Create sequences for LSTM (window size = 5)
-    window_size = 5
-    X_lstm = []
-    y_lstm = []
-    
-    for i in range(len(magnitudes) - window_size):
-        X_lstm.append(magnitudes[i:i+window_size])
-        y_lstm.append(magnitudes[i+window_size])
-    
-    X_lstm = np.array(X_lstm).reshape(-1, window_size, 1)
-    y_lstm = np.array(y_lstm)
-    
-    print(f"\n📊 LSTM training data shape: {X_lstm.shape}")
-    print(f"📊 LSTM target shape: {y_lstm.shape}")
-    
-    # Build LSTM model
-    print("\n🏗️ Building LSTM architecture...")
-    model = keras.Sequential([
-        layers.LSTM(64, return_sequences=True, input_shape=(window_size, 1)),
-        layers.Dropout(0.2),
-        layers.LSTM(32, return_sequences=False),
-        layers.Dropout(0.2),
-        layers.Dense(16, activation='relu'),
-        layers.Dense(1)
-    ])
-    
-    model.compile(
-        optimizer='adam',
-        loss='mse',
-        metrics=['mae']
-    )
-    
-    print(f"   ✅ Model architecture: {model.count_params():,} parameters")
-    
-    # Train LSTM
-    print("\n🎯 Training LSTM model...")
-    history = model.fit(
-        X_lstm, y_lstm,
-        epochs=50,
-        batch_size=8,
-        validation_split=0.2,
-        verbose=0
-    )
-    
-    # Save LSTM model
-    model.save(MODELS_DIR / "lstm_forecaster.h5")
-    print(f"   ✅ LSTM model saved (Final loss: {history.history['loss'][-1]:.4f})")
-    print(f"   ✅ Validation loss: {history.history['val_loss'][-1]:.4f}")
-    
-    # Save scaler for LSTM
-    lstm_stats = {
-        'mean': float(np.mean(magnitudes)),
-        'std': float(np.std(magnitudes)),
-        'min': float(np.min(magnitudes)),
-        'max': float(np.max(magnitudes)),
-        'window_size': window_size
-    }
-    
-    with open(MODELS_DIR / "lstm_stats.json", 'w') as f:
-        json.dump(lstm_stats, f, indent=2)
-    
-    print("\n✅ LSTM Forecaster training complete!")
-    
-except ImportError as e:
-    print(f"⚠️  TensorFlow not available: {e}")
-    print("⚠️  Skipping LSTM training (optional)")
-    print("💡 To enable LSTM: pip install tensorflow")
-except Exception as e:
-    print(f"❌ Error training LSTM model: {e}")
-    import traceback
-    traceback.print_exc()
 
 # ============================================================================
 # Save Training Metadata
 # ============================================================================
-print("\n" + "=" * 70)
-print("💾 Saving Training Metadata")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("💾 Saving Training Metadata")
+logger.info("=" * 70)
 
 metadata = {
     'training_date': datetime.now().isoformat(),
@@ -385,32 +447,34 @@ metadata = {
         'neo_hazard_classifier.pkl',
         'watchman_severity_classifier.pkl',
         'watchman_significance_classifier.pkl',
-        'lstm_forecaster.h5'
+        'lstm_forecaster.keras'
     ],
     'training_data_size': {
         'earthquakes': len(EXPANDED_EARTHQUAKES),
         'celestial_events': len(EXPANDED_CELESTIAL_EVENTS),
-        'total_events': len(watchman_data) if 'watchman_data' in locals() else 0
+        'total_events': len(EXPANDED_CELESTIAL_EVENTS) + len(EXPANDED_EARTHQUAKES)
     },
     'model_versions': {
         'sklearn': '1.3.0',
-        'tensorflow': tf.__version__ if 'tf' in locals() else 'N/A'
-    }
+        'tensorflow': tf.__version__ if 'tf' in locals() else PREVIOUS_METADATA.get('model_versions', {}).get('tensorflow', 'N/A')
+    },
+    # Failed tasks are left out so the next run retrains them
+    'input_hashes': completed_hashes
 }
 
-with open(MODELS_DIR / "training_metadata.json", 'w') as f:
+with open(METADATA_PATH, 'w') as f:
     json.dump(metadata, f, indent=2)
 
-print(f"\n✅ Metadata saved to {MODELS_DIR / 'training_metadata.json'}")
+logger.info(f"\n✅ Metadata saved to {METADATA_PATH}")
 
 # ============================================================================
 # Training Summary
 # ============================================================================
-print("\n" + "=" * 70)
-print("🎉 TRAINING COMPLETE!")
-print("=" * 70)
-print(f"\n📁 Models saved to: {MODELS_DIR}")
-print(f"📊 Total models trained: {len(metadata['models_trained'])}")
-print(f"📅 Training completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-print("\n🚀 Models ready for production use!")
-print("=" * 70)
+logger.info("\n" + "=" * 70)
+logger.info("🎉 TRAINING COMPLETE!")
+logger.info("=" * 70)
+logger.info(f"\n📁 Models saved to: {MODELS_DIR}")
+logger.info(f"📊 Total models trained: {len(metadata['models_trained'])}")
+logger.info(f"📅 Training completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+logger.info("\n🚀 Models ready for production use!")
+logger.info("=" * 70)
@@ -17,8 +17,13 @@ Dataset includes:
 - Solar flares and CME events
 """
 
+import math
+import re
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+import numpy as np
 
 # Expanded training dataset with 100+ events
 TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
@@ -320,7 +325,8 @@ TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
             "eclipses_nearby": ["Solar eclipse 6 days prior"]
         },
         "biblical_reference": "Isaiah 29:6 - Visited with earthquake and great noise",
-        "correlation_score": 0.88
+        "correlation_score": 0.88,
+        "notes": "Last total solar eclipse of millennium, followed by devastating earthquake"
     },
     
     # ========== 2000-2010: 21st Century Begin ==========
@@ -599,7 +605,8 @@ TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
             "eclipses_nearby": ["Supermoon same day"]
         },
         "biblical_reference": "Psalm 46:2 - Though the earth be removed",
-        "correlation_score": 0.88
+        "correlation_score": 0.88,
+        "notes": "Occurred during closest supermoon in 68 years"
     },
     {
         "id": "evt_028",
@@ -884,28 +891,6 @@ TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
     },
     
     # ========== Solar Eclipse Correlations ==========
-    {
-        "id": "evt_041",
-        "date": datetime(1999, 8, 17, 0, 1),
-        "earthquake": {
-            "magnitude": 7.6,
-            "location": "Izmit, Turkey",
-            "lat": 40.75,
-            "lon": 29.86,
-            "depth_km": 17,
-            "casualties": 17127
-        },
-        "celestial_context": {
-            "moon_phase": "First Quarter",
-            "moon_distance_km": 366700,
-            "solar_activity": "High",
-            "planetary_alignments": ["Grand Cross"],
-            "eclipses_nearby": ["Total solar eclipse 6 days prior (August 11)"]
-        },
-        "biblical_reference": "Joel 2:31 - Sun turned to darkness before great day",
-        "correlation_score": 0.90,
-        "notes": "Last total solar eclipse of millennium, followed by devastating earthquake"
-    },
     {
         "id": "evt_042",
         "date": datetime(2009, 7, 15, 9, 22),
@@ -973,28 +958,6 @@ TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
         "correlation_score": 0.95,
         "notes": "Extreme supermoon correlation, 3rd largest earthquake ever recorded"
     },
-    {
-        "id": "evt_045",
-        "date": datetime(2016, 11, 13, 11, 2),
-        "earthquake": {
-            "magnitude": 7.8,
-            "location": "Kaikoura, New Zealand",
-            "lat": -42.69,
-            "lon": 173.02,
-            "depth_km": 15,
-            "casualties": 2
-        },
-        "celestial_context": {
-            "moon_phase": "Full Moon",
-            "moon_distance_km": 356509,
-            "solar_activity": "Low",
-            "planetary_alignments": ["Mercury-Venus conjunction"],
-            "eclipses_nearby": ["Supermoon same day (largest since 1948)"]
-        },
-        "biblical_reference": "Psalm 46:3 - Though mountains shake",
-        "correlation_score": 0.91,
-        "notes": "Occurred during closest supermoon in 68 years"
-    },
     
     # ========== Planetary Alignment Events ==========
     {
@@ -1112,13 +1075,121 @@ TRAINING_DATA_EXPANDED: List[Dict[str, Any]] = [
 ]
 
 
+# Category orders for the integer-coded columns of TRAINING_ARRAYS
+MOON_PHASES = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent"
+)
+SOLAR_ACTIVITY_LEVELS = ("Low", "Moderate", "High", "Very High")
+ECLIPSE_KINDS = ("None", "Solar eclipse", "Lunar eclipse")
+
+# Fixed-point encodings: scores are stored * CORRELATION_SCALE, moon distances
+# as km above MOON_DISTANCE_BASE_KM (perigee never comes closer than ~356,400 km)
+CORRELATION_SCALE = 10000
+MOON_DISTANCE_BASE_KM = 350000
+
+# eclipse_days / supermoon_days value for events with no such note, or one
+# without a parseable offset
+NO_OFFSET_DAYS = np.iinfo(np.int16).max
+
+_ECLIPSE_OFFSET_RE = re.compile(r"(\d+)\s+(day|week)s?\s+(prior|later)|(same day)", re.IGNORECASE)
+
+
+def _eclipse_offset_days(note: str) -> Optional[int]:
+    """Days from the quake to the phenomenon in an eclipses_nearby note, negative when it came first"""
+    match = _ECLIPSE_OFFSET_RE.search(note)
+    if match is None:
+        return None
+    count, unit, direction, same_day = match.groups()
+    if same_day:
+        return 0
+    days = int(count) * (7 if unit.lower() == "week" else 1)
+    return -days if direction.lower() == "prior" else days
+
+
+def _build_arrays(events: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Build one typed NumPy column per numeric field of the event records.
+    
+    Row i of every column describes events[i], so a vectorized mask over the
+    columns selects the matching records with np.flatnonzero.
+    """
+    n = len(events)
+    arrays = {
+        "date": np.empty(n, dtype="datetime64[s]"),
+        "magnitude": np.empty(n, dtype=np.float32),
+        "lat": np.empty(n, dtype=np.float32),
+        "lon": np.empty(n, dtype=np.float32),
+        "depth_km": np.empty(n, dtype=np.float32),
+        "casualties": np.empty(n, dtype=np.int32),
+        "moon_distance_offset_km": np.empty(n, dtype=np.uint16),  # km - MOON_DISTANCE_BASE_KM
+        "moon_phase": np.empty(n, dtype=np.uint8),  # index into MOON_PHASES
+        "solar_activity": np.empty(n, dtype=np.uint8),  # index into SOLAR_ACTIVITY_LEVELS
+        "num_alignments": np.empty(n, dtype=np.uint8),
+        "num_eclipses": np.empty(n, dtype=np.uint8),
+        "eclipse_kind": np.zeros(n, dtype=np.uint8),  # index into ECLIPSE_KINDS
+        "eclipse_days": np.full(n, NO_OFFSET_DAYS, dtype=np.int16),
+        "supermoon": np.zeros(n, dtype=bool),
+        "supermoon_days": np.full(n, NO_OFFSET_DAYS, dtype=np.int16),
+        "correlation_score_q": np.empty(n, dtype=np.int16),  # score * CORRELATION_SCALE
+    }
+    phase_codes = {phase: code for code, phase in enumerate(MOON_PHASES)}
+    solar_codes = {level: code for code, level in enumerate(SOLAR_ACTIVITY_LEVELS)}
+    
+    for i, evt in enumerate(events):
+        quake = evt["earthquake"]
+        sky = evt["celestial_context"]
+        arrays["date"][i] = evt["date"]
+        arrays["magnitude"][i] = quake["magnitude"]
+        arrays["lat"][i] = quake["lat"]
+        arrays["lon"][i] = quake["lon"]
+        arrays["depth_km"][i] = quake["depth_km"]
+        arrays["casualties"][i] = quake["casualties"]
+        arrays["moon_distance_offset_km"][i] = sky["moon_distance_km"] - MOON_DISTANCE_BASE_KM
+        arrays["moon_phase"][i] = phase_codes[sky["moon_phase"]]
+        arrays["solar_activity"][i] = solar_codes[sky["solar_activity"]]
+        arrays["num_alignments"][i] = len(sky["planetary_alignments"])
+        arrays["num_eclipses"][i] = len(sky["eclipses_nearby"])
+        arrays["correlation_score_q"][i] = round(evt["correlation_score"] * CORRELATION_SCALE)
+        
+        # Parse the free-form notes once here instead of in every query
+        for note in sky["eclipses_nearby"]:
+            lowered = note.lower()
+            if "supermoon" in lowered:
+                arrays["supermoon"][i] = True
+            if "solar eclipse" in lowered:
+                arrays["eclipse_kind"][i] = ECLIPSE_KINDS.index("Solar eclipse")
+                offset_column = "eclipse_days"
+            elif "lunar eclipse" in lowered:
+                arrays["eclipse_kind"][i] = ECLIPSE_KINDS.index("Lunar eclipse")
+                offset_column = "eclipse_days"
+            elif "supermoon" in lowered:
+                offset_column = "supermoon_days"
+            else:
+                continue
+            days = _eclipse_offset_days(note)
+            if days is not None and abs(days) < abs(int(arrays[offset_column][i])):
+                arrays[offset_column][i] = days
+    
+    return arrays
+
+
+# Structure-of-arrays view of TRAINING_DATA_EXPANDED for vectorized filters
+TRAINING_ARRAYS = _build_arrays(TRAINING_DATA_EXPANDED)
+
+
+def _select(mask: np.ndarray) -> List[Dict[str, Any]]:
+    """Records of TRAINING_DATA_EXPANDED where mask is True, in dataset order"""
+    return [TRAINING_DATA_EXPANDED[i] for i in np.flatnonzero(mask)]
+
+
 def get_training_data_summary() -> Dict[str, Any]:
     """Get summary statistics of training dataset"""
     return {
         "total_events": len(TRAINING_DATA_EXPANDED),
         "date_range": {
-            "earliest": min(evt["date"] for evt in TRAINING_DATA_EXPANDED),
-            "latest": max(evt["date"] for evt in TRAINING_DATA_EXPANDED)
+            "earliest": TRAINING_ARRAYS["date"].min().item(),
+            "latest": TRAINING_ARRAYS["date"].max().item()
         },
         "magnitude_range": {
             "min": min(evt["earthquake"]["magnitude"] for evt in TRAINING_DATA_EXPANDED),
@@ -1133,15 +1204,55 @@ def get_training_data_summary() -> Dict[str, Any]:
 def get_events_by_celestial_type(celestial_type: str) -> List[Dict[str, Any]]:
     """Filter events by type of celestial phenomenon"""
     if celestial_type == "solar_eclipse":
-        return [evt for evt in TRAINING_DATA_EXPANDED if any("eclipse" in str(e).lower() for e in evt["celestial_context"]["eclipses_nearby"])]
+        return _select(TRAINING_ARRAYS["eclipse_kind"] > 0)
     elif celestial_type == "supermoon":
-        return [evt for evt in TRAINING_DATA_EXPANDED if evt["celestial_context"]["moon_distance_km"] < 358000]
+        return _select(TRAINING_ARRAYS["moon_distance_offset_km"] < 358000 - MOON_DISTANCE_BASE_KM)
     elif celestial_type == "planetary_alignment":
-        return [evt for evt in TRAINING_DATA_EXPANDED if len(evt["celestial_context"]["planetary_alignments"]) > 1]
+        return _select(TRAINING_ARRAYS["num_alignments"] > 1)
     else:
         return []
 
 
 def get_high_correlation_events(threshold: float = 0.85) -> List[Dict[str, Any]]:
     """Get events with correlation scores above threshold"""
-    return [evt for evt in TRAINING_DATA_EXPANDED if evt["correlation_score"] >= threshold]
+    # Smallest fixed-point score that is >= threshold. The product is rounded to
+    # 6 places first so float error (0.29 * 10000 = 2900.0000000000005) cannot
+    # push a threshold that sits on the grid up to the next step.
+    min_score_q = math.ceil(round(threshold * CORRELATION_SCALE, 6))
+    return _select(TRAINING_ARRAYS["correlation_score_q"] >= min_score_q)
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _latlon_to_ecef(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Project lat/lon in degrees onto points of a spherical Earth (km), one row per point"""
+    lat_rad = np.radians(lat, dtype=np.float64)
+    lon_rad = np.radians(lon, dtype=np.float64)
+    return EARTH_RADIUS_KM * np.column_stack((
+        np.cos(lat_rad) * np.cos(lon_rad),
+        np.cos(lat_rad) * np.sin(lon_rad),
+        np.sin(lat_rad),
+    ))
+
+
+@lru_cache(maxsize=1)
+def _epicentre_tree():
+    """KD-tree over the event epicentres, built on first use (scipy import is slow)"""
+    from scipy.spatial import cKDTree
+    return cKDTree(_latlon_to_ecef(TRAINING_ARRAYS["lat"], TRAINING_ARRAYS["lon"]))
+
+
+def find_nearest(lat: float, lon: float, k: int = 5) -> List[Dict[str, Any]]:
+    """
+    Get the k events whose epicentres are closest to (lat, lon), nearest first.
+    
+    Chord length through the sphere increases monotonically with great-circle
+    distance, so a Euclidean k-NN query on ECEF points ranks events exactly
+    as the surface distance would.
+    """
+    k = min(k, len(TRAINING_DATA_EXPANDED))
+    if k <= 0:
+        return []
+    _, indices = _epicentre_tree().query(_latlon_to_ecef(lat, lon)[0], k=k)
+    return [TRAINING_DATA_EXPANDED[i] for i in np.atleast_1d(indices)]
@@ -68,7 +68,9 @@ class Prophecies(Base):
     # Table-level constraints and indexes
     __table_args__ = (
         Index('idx_prophecy_category', 'prophecy_category'),
-        Index('idx_prophecy_order', 'chronological_order'),
+        # Matches the list endpoint's ORDER BY (chronological_order NULLS LAST, id); btree ASC
+        # already sorts NULLs last, so pages are read in index order without a sort step
+        Index('idx_prophecy_order_id', 'chronological_order', 'id'),
         CheckConstraint(
             "prophecy_category IN ('SEAL_JUDGMENT', 'TRUMPET_JUDGMENT', 'BOWL_JUDGMENT', "
             "'DAY_OF_LORD', 'SECOND_COMING', 'TRIBULATION', 'MILLENNIAL_REIGN', "
@@ -211,9 +213,11 @@ class ProphecySignLinks(Base):
     
     # Table-level constraints and indexes
     __table_args__ = (
+        # uq_prophecy_sign's index already covers prophecy_id lookups in
+        # (prophecy_id, sign_id) order; the mirror index does the same for
+        # sign_id lookups, so both link filters are served without a sort
         UniqueConstraint('prophecy_id', 'sign_id', name='uq_prophecy_sign'),
-        Index('idx_prop_sign_prophecy', 'prophecy_id'),
-        Index('idx_prop_sign_sign', 'sign_id'),
+        Index('idx_prop_sign_sign_prophecy', 'sign_id', 'prophecy_id'),
         {'comment': 'Many-to-many junction table linking prophecies to celestial signs'}
     )
     
@@ -2,16 +2,18 @@
 
 import re
 
+DUPLICATE_INDEX_PATTERN = re.compile(
+    r"    op\.create_index\('(?:idx_earthquakes_location|idx_volcanic_activity_location)'.*?\n"
+)
+
 filepath = r"F:\Projects\phobetron_web_app\backend\alembic\versions\5fa859e69904_001_initial_scientific_schema.py"
 
 with open(filepath, 'r') as f:
     content = f.read()
 
-# Remove duplicate GIST index for earthquakes (keep the first one with 'idx_earthquake_location')
-content = re.sub(r"    op\.create_index\('idx_earthquakes_location'.*?\n", '', content)
-
-# Remove duplicate index for volcanic activity location (keep the first 'idx_volcanic_location')
-content = re.sub(r"    op\.create_index\('idx_volcanic_activity_location'.*?\n", '', content)
+# Remove the duplicate location indexes in one pass (keeping the first
+# 'idx_earthquake_location' and 'idx_volcanic_location' definitions)
+content = DUPLICATE_INDEX_PATTERN.sub('', content)
 
 # Write back
 with open(filepath, 'w') as f:
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Bring theological table indexes in existing databases in line with the models
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.db.session import SessionLocal
+from sqlalchemy import text
+
+def create_theological_indexes():
+    """Create the ordering indexes used by the theological list endpoints"""
+    db = SessionLocal()
+
+    try:
+        # The prophecies page is ordered by (chronological_order NULLS LAST, id);
+        # an index on both columns serves it in order, replacing the single-column one
+        create_index_sql = """
+        -- Index builds on populated tables outlast the 5s statement timeout
+        SET LOCAL statement_timeout = 0;
+
+        CREATE INDEX IF NOT EXISTS idx_prophecy_order_id
+            ON prophecies (chronological_order, id);
+        DROP INDEX IF EXISTS idx_prophecy_order;
+
+        -- Links are ordered by (prophecy_id, sign_id): uq_prophecy_sign serves
+        -- the prophecy_id filter, the mirror index serves the sign_id filter
+        CREATE INDEX IF NOT EXISTS idx_prop_sign_sign_prophecy
+            ON prophecy_sign_links (sign_id, prophecy_id);
+        DROP INDEX IF EXISTS idx_prop_sign_sign;
+        DROP INDEX IF EXISTS idx_prop_sign_prophecy;
+        """
+
+        print("Creating theological indexes...")
+        db.execute(text(create_index_sql))
+        db.commit()
+        print("✅ Theological indexes created successfully!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error creating indexes: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    create_theological_indexes()
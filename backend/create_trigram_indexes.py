@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Create pg_trgm GIN indexes for the theological name filters
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.db.session import SessionLocal
+from sqlalchemy import text
+
+def create_trigram_indexes():
+    """Create trigram indexes backing the ILIKE '%...%' name filters"""
+    db = SessionLocal()
+
+    try:
+        # Leading-wildcard ILIKE cannot use the btree name indexes;
+        # gin_trgm_ops lets Postgres answer it from an index instead of a seq scan
+        create_index_sql = """
+        -- Index builds on populated tables outlast the 5s statement timeout
+        SET LOCAL statement_timeout = 0;
+
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+        CREATE INDEX IF NOT EXISTS ix_prophecies_event_name_trgm
+            ON prophecies USING gin (event_name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS ix_celestial_signs_sign_name_trgm
+            ON celestial_signs USING gin (sign_name gin_trgm_ops);
+        """
+
+        print("Creating trigram indexes...")
+        db.execute(text(create_index_sql))
+        db.commit()
+        print("✅ Trigram indexes created successfully!")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Error creating indexes: {e}")
+        raise
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    create_trigram_indexes()
@@ -2,7 +2,7 @@
 Query theological data to demonstrate relationships.
 Shows how prophecies link to multiple celestial signs.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from app.db.session import engine
 from app.models.theological import Prophecies, CelestialSigns
 
@@ -12,8 +12,10 @@ def main():
     print("=== Theological Data Relationships ===\n")
     
     with Session(engine) as db:
-        # Query all prophecies with their linked signs
-        prophecies = db.query(Prophecies).order_by(Prophecies.chronological_order).all()
+        # Query all prophecies with their linked signs (fetched in one extra SELECT)
+        prophecies = db.query(Prophecies).options(
+            selectinload(Prophecies.celestial_signs)
+        ).order_by(Prophecies.chronological_order).all()
         
         print(f"Total Prophecies: {len(prophecies)}\n")
         
@@ -35,7 +37,9 @@ def main():
         print(f"\n{'='*80}")
         print("🔍 Example: 'Great Earthquake' Sign Details\n")
         
-        earthquake = db.query(CelestialSigns).filter_by(sign_name="Great Earthquake").first()
+        earthquake = db.query(CelestialSigns).options(
+            selectinload(CelestialSigns.prophecies)
+        ).filter_by(sign_name="Great Earthquake").first()
         if earthquake:
             print(f"Sign: {earthquake.sign_name}")
             print(f"Type: {earthquake.sign_type}")
@@ -52,41 +56,20 @@ def main():
         print(f"\n{'='*80}")
         print("📋 Prophecies by Category:\n")
         
-        seal_judgments = db.query(Prophecies).filter_by(
-            prophecy_category="SEAL_JUDGMENT"
-        ).order_by(Prophecies.chronological_order).all()
-        
-        print(f"SEAL_JUDGMENT ({len(seal_judgments)}):")
-        for p in seal_judgments:
-            print(f"  {p.chronological_order}. {p.event_name}")
-        
-        trumpet_judgments = db.query(Prophecies).filter_by(
-            prophecy_category="TRUMPET_JUDGMENT"
-        ).order_by(Prophecies.chronological_order).all()
-        
-        print(f"\nTRUMPET_JUDGMENT ({len(trumpet_judgments)}):")
-        for p in trumpet_judgments:
-            print(f"  {p.chronological_order}. {p.event_name}")
-        
-        bowl_judgments = db.query(Prophecies).filter_by(
-            prophecy_category="BOWL_JUDGMENT"
-        ).order_by(Prophecies.chronological_order).all()
-        
-        print(f"\nBOWL_JUDGMENT ({len(bowl_judgments)}):")
-        for p in bowl_judgments:
-            print(f"  {p.chronological_order}. {p.event_name}")
+        # Partition the prophecies already loaded above (still in chronological order)
+        for index, category in enumerate(("SEAL_JUDGMENT", "TRUMPET_JUDGMENT", "BOWL_JUDGMENT")):
+            judgments = [p for p in prophecies if p.prophecy_category == category]
+            
+            if index:
+                print()
+            print(f"{category} ({len(judgments)}):")
+            for p in judgments:
+                print(f"  {p.chronological_order}. {p.event_name}")
         
         # Sign types summary
         print(f"\n{'='*80}")
         print("🌠 Celestial Signs by Type:\n")
         
-        sign_types = db.query(
-            CelestialSigns.sign_type,
-            db.query(CelestialSigns).filter(
-                CelestialSigns.sign_type == CelestialSigns.sign_type
-            ).count()
-        ).group_by(CelestialSigns.sign_type).all()
-        
         all_signs = db.query(CelestialSigns).order_by(CelestialSigns.sign_type, CelestialSigns.sign_name).all()
         
         current_type = None
@@ -21,13 +21,31 @@ echo "Environment variables:"
 echo "  PORT=$PORT"
 echo "  DATABASE_URL=${DATABASE_URL:0:30}... (truncated)"
 echo "  RAILWAY_ENVIRONMENT=${RAILWAY_ENVIRONMENT:-not set}"
+echo "  WEB_CONCURRENCY=${WEB_CONCURRENCY:-not set}"
 echo ""
 
+# One worker per core, capped at 4. Workers share nothing in memory:
+# - the DB connection budget (DB_MAX_CONNECTIONS, default 50, which must stay
+#   below Postgres max_connections) is split evenly between them by
+#   app/db/session.py, which reads WEB_CONCURRENCY exported here
+# - the ESA concurrency cap is split the same way
+# - response caches, the status refresher and the ML models are per-worker
+#   copies, so each worker warms and refreshes its own
+WORKERS="${WEB_CONCURRENCY:-$(( $(nproc) < 4 ? $(nproc) : 4 ))}"
+export WEB_CONCURRENCY="$WORKERS"
+echo "Using WORKERS: $WORKERS (DB_MAX_CONNECTIONS=${DB_MAX_CONNECTIONS:-50} shared)"
+
 # Start uvicorn - the /health endpoint will respond immediately
 # Database connectivity and migrations are handled by the application lifespan
+# Access logging is off (errors are still logged); Railway's proxy supplies client IPs
 exec uvicorn app.main:app \
     --host 0.0.0.0 \
     --port $PORT \
+    --workers "$WORKERS" \
+    --loop uvloop \
+    --http httptools \
     --log-level info \
-    --access-log \
+    --no-access-log \
+    --proxy-headers \
+    --forwarded-allow-ips "*" \
     --timeout-keep-alive 120
@@ -341,7 +341,8 @@ class ComprehensiveMLTrainer:
             max_depth=10,
             min_samples_split=5,
             random_state=42,
-            class_weight='balanced'
+            class_weight='balanced',
+            n_jobs=-1
         )
         
         rf_classifier.fit(X_train, y_train)
@@ -350,8 +351,8 @@ class ComprehensiveMLTrainer:
         train_score = rf_classifier.score(X_train, y_train)
         test_score = rf_classifier.score(X_test, y_test)
         
-        # Cross-validation
-        cv_scores = cross_val_score(rf_classifier, X, y, cv=5)
+        # Cross-validation (folds fit in parallel)
+        cv_scores = cross_val_score(rf_classifier, X, y, cv=5, n_jobs=-1)
         
         # Feature importance
         feature_importance = dict(zip(
@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 from app.db.base import Base
 from app.main import app
 from app.db.session import get_db
+from app.models.theological import Prophecies, CelestialSigns
 
 
 @pytest.fixture(scope="session")
@@ -35,37 +36,88 @@ def engine(test_database_url):
     return create_engine(test_database_url, echo=False)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def tables(engine):
     """
-    Create all tables before each test and drop after.
+    Create all tables once for the test session and drop them at the end.
     
-    Ensures a clean database state for each test.
+    Per-test isolation comes from the rolled-back transaction in db_session.
     """
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
 
 
-@pytest.fixture(scope="function")
-def db_session(engine, tables):
+@pytest.fixture(scope="session")
+def connection(engine, tables):
     """
-    Create a new database session for a test.
+    Open one database connection for the whole test session.
     
-    Returns a SQLAlchemy session that automatically rolls back
-    after the test completes.
+    Everything runs inside a single outer transaction that is rolled back
+    once all tests have finished.
     """
     connection = engine.connect()
     transaction = connection.begin()
-    session = sessionmaker(bind=connection)()
     
-    yield session
+    yield connection
     
-    session.close()
     transaction.rollback()
     connection.close()
 
 
+@pytest.fixture(scope="function")
+def db_session(connection):
+    """
+    Create a new database session for a test.
+    
+    Returns a SQLAlchemy session bound to the shared connection inside a
+    SAVEPOINT that is rolled back after the test completes. Commits made by
+    the test (or the code under test) only release a nested SAVEPOINT, so
+    nothing leaks between tests.
+    """
+    savepoint = connection.begin_nested()
+    session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")()
+    
+    yield session
+    
+    session.close()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="function")
+def prophecy_factory(db_session):
+    """
+    Create Prophecies rows for a test.
+    
+    Each call builds a row from the given fields, adds it to db_session and
+    flushes, so the row has an id and is visible to the API through the
+    shared session. No commit is needed; the db_session rollback removes it.
+    """
+    def create(**fields):
+        prophecy = Prophecies(**fields)
+        db_session.add(prophecy)
+        db_session.flush()
+        return prophecy
+    
+    return create
+
+
+@pytest.fixture(scope="function")
+def celestial_sign_factory(db_session):
+    """
+    Create CelestialSigns rows for a test.
+    
+    Works like prophecy_factory: add, flush and return the row.
+    """
+    def create(**fields):
+        sign = CelestialSigns(**fields)
+        db_session.add(sign)
+        db_session.flush()
+        return sign
+    
+    return create
+
+
 @pytest.fixture(scope="function")
 def client(db_session):
     """
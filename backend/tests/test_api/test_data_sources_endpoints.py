@@ -0,0 +1,77 @@
+"""Tests for the data source response cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app.api.routes import data_sources
+from app.api.routes.data_sources import _cached, _response_cache
+
+
+def make_app():
+    """Stand-in for the FastAPI app: _cached only needs app.state."""
+    return SimpleNamespace(state=SimpleNamespace())
+
+
+def counting_loader(calls, payload):
+    """Loader that records each upstream call."""
+    async def load():
+        calls.append(payload)
+        return payload
+    return load
+
+
+class TestResponseCache:
+    """Tests for _cached expiry, force_refresh and the size bound."""
+    
+    def test_hit_serves_encoded_body(self):
+        """Test that a fresh entry is served without calling the loader again."""
+        app, calls = make_app(), []
+        loader = counting_loader(calls, {"total": 1})
+        
+        first = asyncio.run(_cached(app, ("neo-objects", 1), 300, loader))
+        second = asyncio.run(_cached(app, ("neo-objects", 1), 300, loader))
+        
+        assert first == second == b'{"total":1}'
+        assert len(calls) == 1
+    
+    def test_expired_entry_is_reloaded(self):
+        """Test that an expired entry calls the loader again."""
+        app, calls = make_app(), []
+        loader = counting_loader(calls, {"total": 1})
+        
+        asyncio.run(_cached(app, ("neo-objects", 1), 0, loader))
+        asyncio.run(_cached(app, ("neo-objects", 1), 0, loader))
+        
+        assert len(calls) == 2
+    
+    def test_force_refresh_bypasses_fresh_entry(self):
+        """Test that force_refresh reloads even when the entry is fresh."""
+        app, calls = make_app(), []
+        loader = counting_loader(calls, {"total": 1})
+        
+        asyncio.run(_cached(app, ("neo-objects", 1), 300, loader))
+        asyncio.run(_cached(app, ("neo-objects", 1), 300, loader, force_refresh=True))
+        
+        assert len(calls) == 2
+    
+    def test_insert_purges_expired_entries(self):
+        """Test that inserting a new key drops entries that have expired."""
+        app = make_app()
+        
+        asyncio.run(_cached(app, ("old",), 0, counting_loader([], {})))
+        asyncio.run(_cached(app, ("new",), 300, counting_loader([], {})))
+        
+        assert list(_response_cache(app)) == [("new",)]
+    
+    def test_size_bound_evicts_least_recently_used(self, monkeypatch):
+        """Test that the cache never exceeds its bound and evicts the LRU entry."""
+        monkeypatch.setattr(data_sources, "RESPONSE_CACHE_MAX_ENTRIES", 3)
+        app = make_app()
+        
+        for key in ("a", "b", "c"):
+            asyncio.run(_cached(app, (key,), 300, counting_loader([], {})))
+        # Touch "a" so "b" becomes the least recently used
+        asyncio.run(_cached(app, ("a",), 300, counting_loader([], {})))
+        asyncio.run(_cached(app, ("d",), 300, counting_loader([], {})))
+        
+        assert list(_response_cache(app)) == [("c",), ("a",), ("d",)]